@@ -8,6 +8,7 @@ import (
 	"os/signal"
 	"syscall"
 
+	"github.com/google/uuid"
 	"github.com/timmy/emomo/internal/config"
 	"github.com/timmy/emomo/internal/logger"
 	"github.com/timmy/emomo/internal/repository"
@@ -47,6 +48,11 @@ func main() {
 	logger.SetDefaultLogger(appLogger)
 	defer logger.Sync() // Ensure logs are flushed on exit
 
+	// Every ingested image mints several UUIDs (meme, description, vector rows,
+	// job ID); draw them from a pooled random buffer instead of one
+	// crypto/rand read each. Must be enabled before any goroutine calls uuid.New.
+	uuid.EnableRandPool()
+
 	// Parse command line flags
 	sourceType := flag.String("source", "localdir", "Data source to ingest from")
 	sourcePath := flag.String("path", "", "Local static image directory path; overrides sources.localdir.root_path")
@@ -13,6 +13,7 @@
 //
 //	go run ./cmd/reembed --embedding jina --limit 5 --workers 4
 //	go run ./cmd/reembed --embedding jina --workers 8        # full backfill
+//	go run ./cmd/reembed --embedding jina --workers 8 --rate 5  # cap at 5 embeds/s
 package main
 
 import (
@@ -50,12 +51,17 @@ func main() {
 	logger.SetDefaultLogger(appLogger)
 	defer logger.Sync()
 
+	// Each re-embedded vector mints a point ID and a meme_vectors row ID; draw
+	// them from a pooled random buffer. Must be enabled before workers start.
+	uuid.EnableRandPool()
+
 	configPath := flag.String("config", "", "Path to config file (defaults to ./configs/config.yaml)")
 	embeddingName := flag.String("embedding", "", "Embedding config name (e.g. 'jina'). Defaults to the config's default embedding")
 	profileName := flag.String("profile", "", "Search profile name for multi-vector backfill (e.g. 'qwen3vl')")
 	vectorType := flag.String("vector-type", "all", "Vector type to backfill when using --profile: image, caption, or all")
 	limit := flag.Int("limit", 0, "Maximum memes to (re)embed; 0 = no limit")
 	workers := flag.Int("workers", 4, "Number of concurrent workers")
+	rate := flag.Float64("rate", 0, "Maximum embedding requests per second across all workers; 0 = unlimited")
 	dryRun := flag.Bool("dry-run", false, "Plan only: count memes that would be embedded but do not call any APIs")
 	force := flag.Bool("force", false, "Re-embed even if a meme_vectors row already exists for the target collection")
 	flag.Parse()
@@ -134,6 +140,7 @@ func main() {
 		"vector_indexes": len(vectorIndexes),
 		"limit":          *limit,
 		"workers":        *workers,
+		"rate":           *rate,
 		"dry_run":        *dryRun,
 		"force":          *force,
 	}).Info("Starting reembed")
@@ -153,6 +160,7 @@ func main() {
 		descRepo:      descRepo,
 		objectStorage: objectStorage,
 		vectorIndexes: vectorIndexes,
+		limiter:       newRateLimiter(*rate, *workers),
 		dryRun:        *dryRun,
 		force:         *force,
 	}
@@ -251,13 +259,19 @@ func filterVectorIndexes(indexes []service.IngestVectorIndex, vectorType string,
 // Worker
 // =============================================================================
 
+// memeLister is the part of the meme repository the page fetcher uses.
+type memeLister interface {
+	ListByStatus(ctx context.Context, status domain.MemeStatus, limit, offset int) ([]domain.Meme, error)
+}
+
 type worker struct {
 	log           *logger.Logger
-	memeRepo      *repository.MemeRepository
+	memeRepo      memeLister
 	vectorRepo    *repository.MemeVectorRepository
 	descRepo      *repository.MemeDescriptionRepository
 	objectStorage storage.ObjectStorage
 	vectorIndexes []service.IngestVectorIndex
+	limiter       *rateLimiter
 	dryRun        bool
 	force         bool
 }
@@ -272,16 +286,23 @@ type runStats struct {
 
 const pageSize = 200
 
+// reembedJob is one meme together with the vector routes it still needs.
+type reembedJob struct {
+	meme    domain.Meme
+	indexes []service.IngestVectorIndex
+}
+
 // run streams memes (status=active) page-by-page and feeds them through a
 // fixed pool of workers. Each worker may concurrently call the embedding API
 // and upsert into Qdrant — both backends tolerate parallelism, but the user
-// can throttle via --workers if they want to respect Jina rate limits.
+// can throttle via --rate (or --workers) if they want to respect Jina rate
+// limits.
 func (w *worker) run(ctx context.Context, limit, workers int) (runStats, error) {
 	if workers <= 0 {
 		workers = 1
 	}
 
-	jobs := make(chan domain.Meme, workers*2)
+	jobs := make(chan reembedJob, workers*2)
 	stats := runStats{}
 
 	var wg sync.WaitGroup
@@ -289,11 +310,11 @@ func (w *worker) run(ctx context.Context, limit, workers int) (runStats, error)
 		wg.Add(1)
 		go func(workerID int) {
 			defer wg.Done()
-			for meme := range jobs {
+			for job := range jobs {
 				if ctx.Err() != nil {
 					return
 				}
-				w.processOne(ctx, meme, &stats)
+				w.processOne(ctx, job, &stats)
 			}
 		}(i)
 	}
@@ -301,48 +322,131 @@ func (w *worker) run(ctx context.Context, limit, workers int) (runStats, error)
 	go func() {
 		defer close(jobs)
 
-		offset := 0
-		emitted := 0
-		for {
-			if ctx.Err() != nil {
-				return
-			}
+		// Stop the page fetcher once we return early (limit reached, error).
+		pageCtx, stopPages := context.WithCancel(ctx)
+		defer stopPages()
 
-			memes, err := w.memeRepo.ListByStatus(ctx, domain.MemeStatusActive, pageSize, offset)
-			if err != nil {
-				w.log.WithError(err).WithField("offset", offset).Error("Failed to list memes; aborting page")
-				return
-			}
-			if len(memes) == 0 {
+		emitted := 0
+		for page := range w.fetchPages(pageCtx) {
+			if page.err != nil {
+				w.log.WithError(page.err).WithField("offset", page.offset).Error("Failed to load meme page; aborting")
 				return
 			}
 
-			for _, meme := range memes {
+			for _, meme := range page.memes {
 				if limit > 0 && emitted >= limit {
 					return
 				}
+				indexes := page.pending[meme.MD5Hash]
+				if len(indexes) == 0 {
+					// Every route already exists: skip before any storage or
+					// description lookups are spent on this meme.
+					atomic.AddInt64(&stats.Scanned, 1)
+					atomic.AddInt64(&stats.SkippedExisted, 1)
+					continue
+				}
 				select {
 				case <-ctx.Done():
 					return
-				case jobs <- meme:
+				case jobs <- reembedJob{meme: meme, indexes: indexes}:
 					emitted++
 				}
 			}
+		}
+	}()
+
+	wg.Wait()
+	return stats, ctx.Err()
+}
+
+// pagePrefetch is how many meme pages are loaded ahead of the page being
+// dispatched to workers.
+const pagePrefetch = 2
+
+// memePage is one page of active memes with their missing vector routes.
+type memePage struct {
+	offset  int
+	memes   []domain.Meme
+	pending map[string][]service.IngestVectorIndex
+	err     error
+}
+
+// fetchPages loads meme pages (and their existing-vector lookups) in the
+// background, up to pagePrefetch pages ahead, so the next page's database
+// round trips overlap with dispatching the current one. The channel is closed
+// after the last page, after an error page, or when ctx is done.
+func (w *worker) fetchPages(ctx context.Context) <-chan memePage {
+	pages := make(chan memePage, pagePrefetch)
+	go func() {
+		defer close(pages)
+
+		send := func(page memePage) bool {
+			select {
+			case <-ctx.Done():
+				return false
+			case pages <- page:
+				return true
+			}
+		}
+
+		for offset := 0; ctx.Err() == nil; offset += pageSize {
+			memes, err := w.memeRepo.ListByStatus(ctx, domain.MemeStatusActive, pageSize, offset)
+			if err != nil {
+				send(memePage{offset: offset, err: fmt.Errorf("failed to list memes: %w", err)})
+				return
+			}
+			if len(memes) == 0 {
+				return
+			}
+
+			pending, err := w.pendingIndexes(ctx, memes)
+			if err != nil {
+				send(memePage{offset: offset, err: fmt.Errorf("failed to check existing vectors: %w", err)})
+				return
+			}
+			if !send(memePage{offset: offset, memes: memes, pending: pending}) {
+				return
+			}
 
 			if len(memes) < pageSize {
 				return
 			}
-			offset += pageSize
 		}
 	}()
+	return pages
+}
 
-	wg.Wait()
-	return stats, ctx.Err()
+// pendingIndexes resolves, for a whole page of memes, which vector routes are
+// still missing. Existing routes are fetched with one query per page instead
+// of one existence query per meme and index.
+func (w *worker) pendingIndexes(ctx context.Context, memes []domain.Meme) (map[string][]service.IngestVectorIndex, error) {
+	pending := make(map[string][]service.IngestVectorIndex, len(memes))
+	if w.force {
+		for _, meme := range memes {
+			pending[meme.MD5Hash] = w.vectorIndexes
+		}
+		return pending, nil
+	}
+
+	md5Hashes := make([]string, 0, len(memes))
+	for _, meme := range memes {
+		md5Hashes = append(md5Hashes, meme.MD5Hash)
+	}
+	existing, err := w.vectorRepo.ListRoutesByMD5s(ctx, md5Hashes)
+	if err != nil {
+		return nil, err
+	}
+
+	for _, meme := range memes {
+		pending[meme.MD5Hash] = service.MissingVectorIndexes(w.vectorIndexes, existing[meme.MD5Hash])
+	}
+	return pending, nil
 }
 
 // processOne handles a single meme. It is called from a worker goroutine, so
 // it talks to its own copy of `meme` and only mutates `stats` via atomics.
-func (w *worker) processOne(ctx context.Context, meme domain.Meme, stats *runStats) {
+func (w *worker) processOne(ctx context.Context, job reembedJob, stats *runStats) {
+	meme := job.meme
 	atomic.AddInt64(&stats.Scanned, 1)
 
 	if meme.StorageKey == "" {
@@ -400,8 +504,8 @@ func (w *worker) processOne(ctx context.Context, meme domain.Meme, stats *runSta
 
 	if w.dryRun {
 		planned := 0
-		for _, index := range w.vectorIndexes {
-			if w.shouldProcessIndex(ctx, meme, index, captionText, stats) {
+		for _, index := range job.indexes {
+			if w.shouldProcessIndex(meme, index, captionText, stats) {
 				planned++
 			}
 		}
@@ -418,8 +522,8 @@ func (w *worker) processOne(ctx context.Context, meme domain.Meme, stats *runSta
 
 	embedStart := time.Now()
 	wrote := 0
-	for _, index := range w.vectorIndexes {
-		if !w.shouldProcessIndex(ctx, meme, index, captionText, stats) {
+	for _, index := range job.indexes {
+		if !w.shouldProcessIndex(meme, index, captionText, stats) {
 			continue
 		}
 		if err := w.processVectorIndex(ctx, meme, index, vectorPayloadInput{
@@ -460,7 +564,9 @@ type vectorPayloadInput struct {
 	Payload       *repository.MemePayload
 }
 
-func (w *worker) shouldProcessIndex(ctx context.Context, meme domain.Meme, index service.IngestVectorIndex, captionText string, stats *runStats) bool {
+// shouldProcessIndex reports whether a pending route can be embedded for the
+// meme. Vector existence has already been resolved per page by pendingIndexes.
+func (w *worker) shouldProcessIndex(meme domain.Meme, index service.IngestVectorIndex, captionText string, stats *runStats) bool {
 	if index.VectorType == domain.MemeVectorTypeCaption && captionText == "" {
 		atomic.AddInt64(&stats.SkippedNoURL, 1)
 		w.log.WithFields(logger.Fields{
@@ -470,21 +576,6 @@ func (w *worker) shouldProcessIndex(ctx context.Context, meme domain.Meme, index
 		}).Warn("Skipping caption vector because caption text is empty")
 		return false
 	}
-	if !w.force {
-		exists, err := w.vectorRepo.ExistsByMD5CollectionAndVectorType(ctx, meme.MD5Hash, index.Collection, index.VectorType)
-		if err != nil {
-			atomic.AddInt64(&stats.Failed, 1)
-			w.log.WithError(err).WithFields(logger.Fields{
-				"meme_id":     meme.ID,
-				"collection":  index.Collection,
-				"vector_type": index.VectorType,
-			}).Error("Failed to check vector existence")
-			return false
-		}
-		if exists {
-			return false
-		}
-	}
 	return true
 }
 
@@ -570,8 +661,8 @@ func (w *worker) embedWithRetry(ctx context.Context, provider service.EmbeddingP
 
 	var lastErr error
 	for attempt := 1; attempt <= maxAttempts; attempt++ {
-		if ctx.Err() != nil {
-			return nil, ctx.Err()
+		if err := w.limiter.Wait(ctx); err != nil {
+			return nil, err
 		}
 		vec, err := provider.EmbedDocument(ctx, doc)
 		if err == nil {
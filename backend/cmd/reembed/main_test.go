@@ -0,0 +1,219 @@
+package main
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"io"
+	"reflect"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/timmy/emomo/internal/domain"
+	"github.com/timmy/emomo/internal/logger"
+	"github.com/timmy/emomo/internal/repository"
+	"github.com/timmy/emomo/internal/service"
+	"gorm.io/driver/sqlite"
+	"gorm.io/gorm"
+)
+
+func newTestVectorRepository(t *testing.T) (*gorm.DB, *repository.MemeVectorRepository) {
+	t.Helper()
+
+	db, err := gorm.Open(sqlite.Open(":memory:"), &gorm.Config{})
+	if err != nil {
+		t.Fatalf("failed to open sqlite: %v", err)
+	}
+	if err := db.AutoMigrate(&domain.MemeVector{}); err != nil {
+		t.Fatalf("failed to migrate meme_vectors: %v", err)
+	}
+	return db, repository.NewMemeVectorRepository(db)
+}
+
+func TestPendingIndexesResolvesMissingRoutesPerMeme(t *testing.T) {
+	t.Parallel()
+
+	db, vectorRepo := newTestVectorRepository(t)
+	ctx := context.Background()
+
+	imageIndex := service.IngestVectorIndex{Collection: "emomo_image", VectorType: domain.MemeVectorTypeImage}
+	captionIndex := service.IngestVectorIndex{Collection: "emomo_caption", VectorType: domain.MemeVectorTypeCaption}
+	// An index without a type routes to image vectors, as it does in ingest.
+	untypedIndex := service.IngestVectorIndex{Collection: "emomo_legacy"}
+
+	vectors := []struct {
+		md5Hash    string
+		collection string
+		vectorType string
+	}{
+		{"partial", "emomo_image", domain.MemeVectorTypeImage},
+		{"complete", "emomo_image", domain.MemeVectorTypeImage},
+		{"complete", "emomo_caption", domain.MemeVectorTypeCaption},
+		{"complete", "emomo_legacy", domain.MemeVectorTypeImage},
+		{"legacy", "emomo_legacy", ""},
+	}
+	for i, v := range vectors {
+		vector := domain.MemeVector{
+			ID:            v.md5Hash + "-" + v.collection,
+			MemeID:        "meme-" + v.md5Hash,
+			MD5Hash:       v.md5Hash,
+			Collection:    v.collection,
+			VectorType:    v.vectorType,
+			QdrantPointID: string(rune('a' + i)),
+			Status:        domain.MemeVectorStatusActive,
+			CreatedAt:     time.Now(),
+		}
+		if err := vectorRepo.Create(ctx, &vector); err != nil {
+			t.Fatalf("failed to create vector %s: %v", vector.ID, err)
+		}
+		if v.vectorType == "" {
+			// Rows written before vector types existed carry an empty type.
+			if err := db.Model(&domain.MemeVector{}).Where("id = ?", vector.ID).Update("vector_type", "").Error; err != nil {
+				t.Fatalf("failed to clear vector type: %v", err)
+			}
+		}
+	}
+
+	memes := []domain.Meme{
+		{ID: "meme-partial", MD5Hash: "partial"},
+		{ID: "meme-complete", MD5Hash: "complete"},
+		{ID: "meme-legacy", MD5Hash: "legacy"},
+		{ID: "meme-new", MD5Hash: "new"},
+	}
+	indexes := []service.IngestVectorIndex{imageIndex, captionIndex, untypedIndex}
+
+	w := &worker{vectorRepo: vectorRepo, vectorIndexes: indexes}
+	pending, err := w.pendingIndexes(ctx, memes)
+	if err != nil {
+		t.Fatalf("pendingIndexes() error = %v", err)
+	}
+	want := map[string][]service.IngestVectorIndex{
+		"partial":  {captionIndex, untypedIndex},
+		"complete": {},
+		"legacy":   {imageIndex, captionIndex},
+		"new":      indexes,
+	}
+	if !reflect.DeepEqual(pending, want) {
+		t.Fatalf("pendingIndexes() = %+v, want %+v", pending, want)
+	}
+
+	w.force = true
+	pending, err = w.pendingIndexes(ctx, memes)
+	if err != nil {
+		t.Fatalf("pendingIndexes(force) error = %v", err)
+	}
+	for _, meme := range memes {
+		if got := pending[meme.MD5Hash]; !reflect.DeepEqual(got, indexes) {
+			t.Fatalf("pendingIndexes(force)[%s] = %+v, want every index", meme.MD5Hash, got)
+		}
+	}
+}
+
+// stubMemeLister serves total active memes in pages and can fail at one
+// offset. It counts ListByStatus calls.
+type stubMemeLister struct {
+	total   int
+	failAt  int // offset that returns failErr; negative disables
+	failErr error
+	calls   int64
+}
+
+func (s *stubMemeLister) ListByStatus(_ context.Context, _ domain.MemeStatus, limit, offset int) ([]domain.Meme, error) {
+	atomic.AddInt64(&s.calls, 1)
+	if offset == s.failAt {
+		return nil, s.failErr
+	}
+	memes := make([]domain.Meme, 0, limit)
+	for i := offset; i < s.total && i < offset+limit; i++ {
+		memes = append(memes, domain.Meme{ID: fmt.Sprintf("meme-%d", i), MD5Hash: fmt.Sprintf("md5-%d", i)})
+	}
+	return memes, nil
+}
+
+func newFetchTestWorker(lister memeLister) *worker {
+	return &worker{
+		log:           logger.New(&logger.Config{Level: "error", Output: io.Discard}),
+		memeRepo:      lister,
+		vectorIndexes: []service.IngestVectorIndex{{Collection: "emomo_image", VectorType: domain.MemeVectorTypeImage}},
+		// force skips the vector lookup, so no vector repository is needed.
+		force: true,
+	}
+}
+
+func TestFetchPagesStopsAfterShortFinalPage(t *testing.T) {
+	t.Parallel()
+
+	lister := &stubMemeLister{total: pageSize + 3, failAt: -1}
+	w := newFetchTestWorker(lister)
+
+	var sizes []int
+	for page := range w.fetchPages(context.Background()) {
+		if page.err != nil {
+			t.Fatalf("fetchPages() page error = %v", page.err)
+		}
+		sizes = append(sizes, len(page.memes))
+	}
+	if want := []int{pageSize, 3}; !reflect.DeepEqual(sizes, want) {
+		t.Fatalf("fetchPages() page sizes = %v, want %v", sizes, want)
+	}
+	if calls := atomic.LoadInt64(&lister.calls); calls != 2 {
+		t.Fatalf("ListByStatus calls = %d, want 2 (no query after the short page)", calls)
+	}
+}
+
+func TestFetchPagesForwardsListErrorAndStops(t *testing.T) {
+	t.Parallel()
+
+	listErr := errors.New("database unavailable")
+	lister := &stubMemeLister{total: 10 * pageSize, failAt: pageSize, failErr: listErr}
+	w := newFetchTestWorker(lister)
+
+	var pages []memePage
+	for page := range w.fetchPages(context.Background()) {
+		pages = append(pages, page)
+	}
+	if len(pages) != 2 {
+		t.Fatalf("fetchPages() returned %d pages, want a data page then an error page", len(pages))
+	}
+	if pages[0].err != nil || len(pages[0].memes) != pageSize {
+		t.Fatalf("first page = %d memes, err %v, want a full page", len(pages[0].memes), pages[0].err)
+	}
+	if !errors.Is(pages[1].err, listErr) || pages[1].offset != pageSize {
+		t.Fatalf("second page err = %v at offset %d, want the list error at offset %d", pages[1].err, pages[1].offset, pageSize)
+	}
+
+	// run aborts on the error page after dispatching the first page.
+	stats, err := newFetchTestWorker(lister).run(context.Background(), 0, 2)
+	if err != nil {
+		t.Fatalf("run() error = %v", err)
+	}
+	if stats.Scanned != pageSize {
+		t.Fatalf("run() scanned %d memes, want %d before the failing page", stats.Scanned, pageSize)
+	}
+}
+
+func TestRunStopsFetchingOnceLimitIsReachedMidPage(t *testing.T) {
+	t.Parallel()
+
+	lister := &stubMemeLister{total: 20 * pageSize, failAt: -1}
+	w := newFetchTestWorker(lister)
+
+	limit := pageSize + pageSize/2
+	stats, err := w.run(context.Background(), limit, 2)
+	if err != nil {
+		t.Fatalf("run() error = %v", err)
+	}
+	// The memes have no storage key, so each dispatched one is counted as
+	// scanned and skipped without touching storage.
+	if stats.Scanned != int64(limit) || stats.SkippedNoURL != int64(limit) {
+		t.Fatalf("run() stats = %+v, want %d scanned and skipped", stats, limit)
+	}
+
+	// The fetcher is cancelled when dispatch stops; it may have prefetched a
+	// few pages but must not walk the remaining ones.
+	maxCalls := int64(2 + pagePrefetch + 1)
+	if calls := atomic.LoadInt64(&lister.calls); calls > maxCalls {
+		t.Fatalf("ListByStatus calls = %d, want at most %d after the limit", calls, maxCalls)
+	}
+}
@@ -0,0 +1,89 @@
+package main
+
+import (
+	"context"
+	"sync"
+	"time"
+)
+
+// rateLimiter is a token bucket shared by all workers. Tokens refill
+// continuously at `rate` per second up to `burst`, so workers that start
+// together are smoothed out instead of hitting the provider in lockstep and
+// tripping 429s that then have to be retried.
+type rateLimiter struct {
+	mu     sync.Mutex
+	rate   float64
+	burst  float64
+	tokens float64
+	last   time.Time
+	now    func() time.Time
+}
+
+// newRateLimiter creates a token bucket limiter.
+// Parameters:
+//   - rate: sustained requests per second; <= 0 disables limiting.
+//   - burst: maximum number of requests allowed back to back (min 1).
+//
+// Returns:
+//   - *rateLimiter: limiter, or nil when limiting is disabled.
+func newRateLimiter(rate float64, burst int) *rateLimiter {
+	if rate <= 0 {
+		return nil
+	}
+	if burst < 1 {
+		burst = 1
+	}
+	return &rateLimiter{
+		rate:   rate,
+		burst:  float64(burst),
+		tokens: float64(burst),
+		last:   time.Now(),
+		now:    time.Now,
+	}
+}
+
+// Wait blocks until a token is available or ctx is done. A nil limiter never
+// blocks.
+func (l *rateLimiter) Wait(ctx context.Context) error {
+	if l == nil {
+		return ctx.Err()
+	}
+	for {
+		if err := ctx.Err(); err != nil {
+			return err
+		}
+		wait := l.reserve()
+		if wait <= 0 {
+			return nil
+		}
+		timer := time.NewTimer(wait)
+		select {
+		case <-ctx.Done():
+			timer.Stop()
+			return ctx.Err()
+		case <-timer.C:
+		}
+	}
+}
+
+// reserve takes a token if one is available and otherwise returns how long
+// the caller should wait before trying again.
+func (l *rateLimiter) reserve() time.Duration {
+	l.mu.Lock()
+	defer l.mu.Unlock()
+
+	now := l.now()
+	if elapsed := now.Sub(l.last).Seconds(); elapsed > 0 {
+		l.tokens += elapsed * l.rate
+		if l.tokens > l.burst {
+			l.tokens = l.burst
+		}
+	}
+	l.last = now
+
+	if l.tokens >= 1 {
+		l.tokens--
+		return 0
+	}
+	return time.Duration((1 - l.tokens) / l.rate * float64(time.Second))
+}
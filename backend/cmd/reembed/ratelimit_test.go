@@ -0,0 +1,58 @@
+package main
+
+import (
+	"context"
+	"testing"
+	"time"
+)
+
+func TestRateLimiterAllowsBurstThenWaits(t *testing.T) {
+	t.Parallel()
+
+	now := time.Unix(0, 0)
+	limiter := newRateLimiter(2, 2)
+	limiter.now = func() time.Time { return now }
+	limiter.last = now
+
+	if wait := limiter.reserve(); wait != 0 {
+		t.Fatalf("expected first token immediately, got wait %v", wait)
+	}
+	if wait := limiter.reserve(); wait != 0 {
+		t.Fatalf("expected second token immediately, got wait %v", wait)
+	}
+	if wait := limiter.reserve(); wait != 500*time.Millisecond {
+		t.Fatalf("expected 500ms wait for third token, got %v", wait)
+	}
+
+	now = now.Add(500 * time.Millisecond)
+	if wait := limiter.reserve(); wait != 0 {
+		t.Fatalf("expected token after refill, got wait %v", wait)
+	}
+}
+
+func TestRateLimiterDisabledWhenRateIsZero(t *testing.T) {
+	t.Parallel()
+
+	limiter := newRateLimiter(0, 1)
+	if limiter != nil {
+		t.Fatalf("expected nil limiter for zero rate")
+	}
+	if err := limiter.Wait(context.Background()); err != nil {
+		t.Fatalf("expected nil limiter to never block, got %v", err)
+	}
+}
+
+func TestRateLimiterWaitHonorsCancellation(t *testing.T) {
+	t.Parallel()
+
+	limiter := newRateLimiter(0.001, 1)
+	if err := limiter.Wait(context.Background()); err != nil {
+		t.Fatalf("expected first wait to succeed, got %v", err)
+	}
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	if err := limiter.Wait(ctx); err == nil {
+		t.Fatal("expected canceled context error")
+	}
+}
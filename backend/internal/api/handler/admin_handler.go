@@ -352,17 +352,6 @@ func (h *AdminHandler) TriggerIngest(c *gin.Context) {
 	logger.CtxInfo(ctx, "Received ingest request: source=%s, limit=%d, force=%v, client_ip=%s",
 		req.Source, req.Limit, req.Force, c.ClientIP())
 
-	// Check if ingest is already running
-	h.mu.RLock()
-	if h.isRunning {
-		h.mu.RUnlock()
-		logger.CtxWarn(ctx, "Ingest request rejected: already running, source=%s, client_ip=%s",
-			req.Source, c.ClientIP())
-		c.JSON(http.StatusConflict, gin.H{"error": "Ingest is already running"})
-		return
-	}
-	h.mu.RUnlock()
-
 	// Get source
 	src, ok := h.sources[req.Source]
 	if !ok {
@@ -371,8 +360,16 @@ func (h *AdminHandler) TriggerIngest(c *gin.Context) {
 		return
 	}
 
-	// Set running state
+	// Check and claim the running state under one lock, so two concurrent
+	// requests cannot both observe an idle job and start ingesting.
 	h.mu.Lock()
+	if h.isRunning {
+		h.mu.Unlock()
+		logger.CtxWarn(ctx, "Ingest request rejected: already running, source=%s, client_ip=%s",
+			req.Source, c.ClientIP())
+		c.JSON(http.StatusConflict, gin.H{"error": "Ingest is already running"})
+		return
+	}
 	h.isRunning = true
 	h.currentStats = nil
 	h.mu.Unlock()
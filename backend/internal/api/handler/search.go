@@ -3,6 +3,7 @@ package handler
 import (
 	"encoding/json"
 	"fmt"
+	"io"
 	"net/http"
 
 	"github.com/gin-gonic/gin"
@@ -154,34 +155,73 @@ func (h *SearchHandler) TextSearchStream(c *gin.Context) {
 				<-done
 				// Send final result
 				if searchErr != nil {
-					errData, _ := json.Marshal(gin.H{
-						"stage": "error",
-						"error": searchErr.Error(),
+					errData, _ := json.Marshal(streamErrorEvent{
+						Error: searchErr.Error(),
+						Stage: "error",
 					})
 					fmt.Fprintf(w, "event: error\ndata: %s\n\n", errData)
 				} else if searchResult != nil {
-					resultData, _ := json.Marshal(gin.H{
-						"stage":          "complete",
-						"results":        searchResult.Results,
-						"total":          searchResult.Total,
-						"query":          searchResult.Query,
-						"expanded_query": searchResult.ExpandedQuery,
-						"collection":     searchResult.Collection,
-						"profile":        searchResult.Profile,
+					resultData, _ := json.Marshal(streamCompleteEvent{
+						Collection:    searchResult.Collection,
+						ExpandedQuery: searchResult.ExpandedQuery,
+						Profile:       searchResult.Profile,
+						Query:         searchResult.Query,
+						Results:       searchResult.Results,
+						Stage:         "complete",
+						Total:         searchResult.Total,
 					})
 					fmt.Fprintf(w, "event: complete\ndata: %s\n\n", resultData)
 				}
 				w.Flush()
 				return
 			}
-			// Write SSE event
-			eventType := "progress"
-			if progress.Stage == "thinking" {
-				eventType = "thinking"
+			// Write SSE event, plus any events already queued behind it, so a
+			// burst of thinking deltas goes out in one flush instead of one
+			// per token. A closed channel is handled on the next iteration.
+			writeProgressEvent(w, progress)
+		drain:
+			for {
+				select {
+				case next, ok := <-progressCh:
+					if !ok {
+						break drain
+					}
+					writeProgressEvent(w, next)
+				default:
+					break drain
+				}
 			}
-			data, _ := json.Marshal(progress)
-			fmt.Fprintf(w, "event: %s\ndata: %s\n\n", eventType, data)
 			w.Flush()
 		}
 	}
 }
+
+// streamCompleteEvent and streamErrorEvent are the final SSE payloads. They
+// are encoded straight from typed fields rather than through an interim map
+// that encoding/json would have to sort; field order matches that sorted
+// output so clients see the same bytes.
+type streamCompleteEvent struct {
+	Collection    string                 `json:"collection"`
+	ExpandedQuery string                 `json:"expanded_query"`
+	Profile       string                 `json:"profile"`
+	Query         string                 `json:"query"`
+	Results       []service.SearchResult `json:"results"`
+	Stage         string                 `json:"stage"`
+	Total         int                    `json:"total"`
+}
+
+type streamErrorEvent struct {
+	Error string `json:"error"`
+	Stage string `json:"stage"`
+}
+
+// writeProgressEvent writes one progress update as an SSE event without
+// flushing.
+func writeProgressEvent(w io.Writer, progress service.SearchProgress) {
+	eventType := "progress"
+	if progress.Stage == "thinking" {
+		eventType = "thinking"
+	}
+	data, _ := json.Marshal(progress)
+	fmt.Fprintf(w, "event: %s\ndata: %s\n\n", eventType, data)
+}
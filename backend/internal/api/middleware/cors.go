@@ -6,6 +6,12 @@ import (
 	"github.com/gin-gonic/gin"
 )
 
+const (
+	corsAllowHeaders  = "Content-Type, Content-Length, Accept-Encoding, X-CSRF-Token, Authorization, accept, origin, Cache-Control, X-Requested-With"
+	corsAllowMethods  = "POST, OPTIONS, GET, PUT, DELETE"
+	corsExposeHeaders = "Content-Length"
+)
+
 // CORSConfig holds CORS configuration.
 type CORSConfig struct {
 	AllowedOrigins  []string
@@ -18,6 +24,17 @@ type CORSConfig struct {
 // Returns:
 //   - gin.HandlerFunc: middleware handler.
 func CORS(config CORSConfig) gin.HandlerFunc {
+	// Resolve the allow-list once so each request is a single map lookup.
+	allowAnyListed := false
+	allowedSet := make(map[string]struct{}, len(config.AllowedOrigins))
+	for _, allowedOriginItem := range config.AllowedOrigins {
+		if allowedOriginItem == "*" {
+			allowAnyListed = true
+		}
+		allowedSet[allowedOriginItem] = struct{}{}
+	}
+	restrictOrigins := len(config.AllowedOrigins) > 0 && !allowAnyListed
+
 	return func(c *gin.Context) {
 		origin := c.Request.Header.Get("Origin")
 
@@ -29,32 +46,21 @@ func CORS(config CORSConfig) gin.HandlerFunc {
 			c.Writer.Header().Set("Access-Control-Allow-Credentials", "false")
 		} else {
 			// Check if origin is in allowed list
-			allowed := false
-			for _, allowedOriginItem := range config.AllowedOrigins {
-				if origin == allowedOriginItem || allowedOriginItem == "*" {
-					allowed = true
-					allowedOrigin = origin
-					break
-				}
-			}
-
-			if !allowed && len(config.AllowedOrigins) > 0 {
+			if _, ok := allowedSet[origin]; !ok && restrictOrigins {
 				// Origin not allowed, don't set CORS headers
 				c.Next()
 				return
 			}
 
 			// If no origins configured or origin matches, allow it
-			if allowedOrigin == "" {
-				allowedOrigin = origin
-			}
+			allowedOrigin = origin
 			c.Writer.Header().Set("Access-Control-Allow-Credentials", "true")
 		}
 
 		c.Writer.Header().Set("Access-Control-Allow-Origin", allowedOrigin)
-		c.Writer.Header().Set("Access-Control-Allow-Headers", "Content-Type, Content-Length, Accept-Encoding, X-CSRF-Token, Authorization, accept, origin, Cache-Control, X-Requested-With")
-		c.Writer.Header().Set("Access-Control-Allow-Methods", "POST, OPTIONS, GET, PUT, DELETE")
-		c.Writer.Header().Set("Access-Control-Expose-Headers", "Content-Length")
+		c.Writer.Header().Set("Access-Control-Allow-Headers", corsAllowHeaders)
+		c.Writer.Header().Set("Access-Control-Allow-Methods", corsAllowMethods)
+		c.Writer.Header().Set("Access-Control-Expose-Headers", corsExposeHeaders)
 
 		// Handle preflight requests
 		if c.Request.Method == "OPTIONS" {
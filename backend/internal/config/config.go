@@ -102,6 +102,8 @@ type VLMConfig struct {
 
 // IngestConfig defines ingestion concurrency and batching settings.
 type IngestConfig struct {
+	// Workers is the number of items processed in parallel. Each worker can
+	// have two VLM requests in flight (description and OCR).
 	Workers    int `mapstructure:"workers"`
 	BatchSize  int `mapstructure:"batch_size"`
 	RetryCount int `mapstructure:"retry_count"`
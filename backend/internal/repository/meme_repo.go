@@ -215,6 +215,40 @@ func (r *MemeRepository) CountByStatus(ctx context.Context, status domain.MemeSt
 	return count, nil
 }
 
+// MemeStats holds the aggregate counts reported by the stats endpoint.
+type MemeStats struct {
+	ActiveCount   int64
+	PendingCount  int64
+	CategoryCount int64 // distinct categories among active memes, as GetCategories returns them
+}
+
+// GetStats computes the active count, pending count, and distinct active
+// category count in one aggregate pass over the memes table. COUNT(DISTINCT)
+// skips NULL, whereas SELECT DISTINCT returns it as one more category, so a
+// NULL category is added back to keep CategoryCount equal to
+// len(GetCategories()).
+// Parameters:
+//   - ctx: context for cancellation and deadlines.
+// Returns:
+//   - *MemeStats: aggregate counts.
+//   - error: non-nil if the query fails.
+func (r *MemeRepository) GetStats(ctx context.Context) (*MemeStats, error) {
+	var stats MemeStats
+	if err := r.db.WithContext(ctx).
+		Model(&domain.Meme{}).
+		Select(
+			"COALESCE(SUM(CASE WHEN status = ? THEN 1 ELSE 0 END), 0) AS active_count, "+
+				"COALESCE(SUM(CASE WHEN status = ? THEN 1 ELSE 0 END), 0) AS pending_count, "+
+				"COUNT(DISTINCT CASE WHEN status = ? THEN category END) + "+
+				"COALESCE(MAX(CASE WHEN status = ? AND category IS NULL THEN 1 ELSE 0 END), 0) AS category_count",
+			domain.MemeStatusActive, domain.MemeStatusPending, domain.MemeStatusActive, domain.MemeStatusActive,
+		).
+		Scan(&stats).Error; err != nil {
+		return nil, err
+	}
+	return &stats, nil
+}
+
 // GetByIDs retrieves memes by a list of IDs.
 // Parameters:
 //   - ctx: context for cancellation and deadlines.
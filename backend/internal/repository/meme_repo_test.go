@@ -0,0 +1,97 @@
+package repository
+
+import (
+	"context"
+	"testing"
+
+	"github.com/timmy/emomo/internal/domain"
+	"gorm.io/driver/sqlite"
+	"gorm.io/gorm"
+)
+
+func TestMemeRepositoryGetStatsAggregatesInOneQuery(t *testing.T) {
+	t.Parallel()
+
+	db, err := gorm.Open(sqlite.Open(":memory:"), &gorm.Config{})
+	if err != nil {
+		t.Fatalf("failed to open sqlite: %v", err)
+	}
+	if err := db.AutoMigrate(&domain.Meme{}); err != nil {
+		t.Fatalf("failed to migrate memes: %v", err)
+	}
+
+	repo := NewMemeRepository(db)
+	ctx := context.Background()
+
+	empty, err := repo.GetStats(ctx)
+	if err != nil {
+		t.Fatalf("GetStats on empty table returned error: %v", err)
+	}
+	if *empty != (MemeStats{}) {
+		t.Fatalf("GetStats on empty table = %+v, want zero counts", *empty)
+	}
+
+	memes := []domain.Meme{
+		{ID: "meme-1", SourceType: "localdir", SourceID: "a", MD5Hash: "md5-a", Category: "dog", Status: domain.MemeStatusActive},
+		{ID: "meme-2", SourceType: "localdir", SourceID: "b", MD5Hash: "md5-b", Category: "dog", Status: domain.MemeStatusActive},
+		{ID: "meme-3", SourceType: "localdir", SourceID: "c", MD5Hash: "md5-c", Category: "cat", Status: domain.MemeStatusActive},
+		{ID: "meme-4", SourceType: "localdir", SourceID: "d", MD5Hash: "md5-d", Category: "bird", Status: domain.MemeStatusPending},
+		{ID: "meme-5", SourceType: "localdir", SourceID: "e", MD5Hash: "md5-e", Category: "fish", Status: domain.MemeStatusFailed},
+	}
+	for i := range memes {
+		if err := repo.Create(ctx, &memes[i]); err != nil {
+			t.Fatalf("failed to create meme %s: %v", memes[i].ID, err)
+		}
+	}
+
+	stats, err := repo.GetStats(ctx)
+	if err != nil {
+		t.Fatalf("GetStats returned error: %v", err)
+	}
+	want := MemeStats{ActiveCount: 3, PendingCount: 1, CategoryCount: 2}
+	if *stats != want {
+		t.Fatalf("GetStats = %+v, want %+v", *stats, want)
+	}
+
+	categories, err := repo.GetCategories(ctx)
+	if err != nil {
+		t.Fatalf("GetCategories returned error: %v", err)
+	}
+	if int(stats.CategoryCount) != len(categories) {
+		t.Fatalf("GetStats CategoryCount = %d, GetCategories = %v, want matching", stats.CategoryCount, categories)
+	}
+
+	// Empty and NULL categories each count once, as SELECT DISTINCT returns them.
+	uncategorized := []domain.Meme{
+		{ID: "meme-6", SourceType: "localdir", SourceID: "f", MD5Hash: "md5-f", Category: "", Status: domain.MemeStatusActive},
+		{ID: "meme-7", SourceType: "localdir", SourceID: "g", MD5Hash: "md5-g", Status: domain.MemeStatusActive},
+		{ID: "meme-8", SourceType: "localdir", SourceID: "h", MD5Hash: "md5-h", Status: domain.MemeStatusActive},
+		{ID: "meme-9", SourceType: "localdir", SourceID: "i", MD5Hash: "md5-i", Status: domain.MemeStatusPending},
+	}
+	for i := range uncategorized {
+		if err := repo.Create(ctx, &uncategorized[i]); err != nil {
+			t.Fatalf("failed to create meme %s: %v", uncategorized[i].ID, err)
+		}
+	}
+	if err := db.Exec("UPDATE memes SET category = NULL WHERE id IN ?", []string{"meme-7", "meme-8", "meme-9"}).Error; err != nil {
+		t.Fatalf("failed to clear categories: %v", err)
+	}
+
+	stats, err = repo.GetStats(ctx)
+	if err != nil {
+		t.Fatalf("GetStats returned error: %v", err)
+	}
+	want = MemeStats{ActiveCount: 6, PendingCount: 2, CategoryCount: 4}
+	if *stats != want {
+		t.Fatalf("GetStats with empty and NULL categories = %+v, want %+v", *stats, want)
+	}
+
+	var distinctRows int64
+	if err := db.Raw("SELECT COUNT(*) FROM (SELECT DISTINCT category FROM memes WHERE status = ?) AS c", domain.MemeStatusActive).
+		Scan(&distinctRows).Error; err != nil {
+		t.Fatalf("failed to count distinct categories: %v", err)
+	}
+	if stats.CategoryCount != distinctRows {
+		t.Fatalf("GetStats CategoryCount = %d, SELECT DISTINCT rows = %d, want matching", stats.CategoryCount, distinctRows)
+	}
+}
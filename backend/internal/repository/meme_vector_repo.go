@@ -58,24 +58,62 @@ func (r *MemeVectorRepository) ExistsByMD5AndCollection(ctx context.Context, md5
 	return count > 0, nil
 }
 
-// ExistsByMD5CollectionAndVectorType checks if a typed vector exists for the MD5 hash and collection.
+// MemeVectorRoute identifies the collection and vector type of a stored vector.
+type MemeVectorRoute struct {
+	Collection string
+	VectorType string
+}
+
+// ListRoutesByMD5 returns every collection/vector-type pair that already has a
+// vector record for the MD5 hash, so callers can check all routes with one query.
 // Parameters:
 //   - ctx: context for cancellation and deadlines.
 //   - md5Hash: MD5 hash of the meme content.
-//   - collection: Qdrant collection name.
-//   - vectorType: vector type such as image or caption.
 //
 // Returns:
-//   - bool: true if a matching active or historical record exists.
-//   - error: non-nil if the lookup fails.
-func (r *MemeVectorRepository) ExistsByMD5CollectionAndVectorType(ctx context.Context, md5Hash, collection, vectorType string) (bool, error) {
-	var count int64
+//   - []MemeVectorRoute: distinct routes with an active or historical record.
+//   - error: non-nil if the query fails.
+func (r *MemeVectorRepository) ListRoutesByMD5(ctx context.Context, md5Hash string) ([]MemeVectorRoute, error) {
+	routes, err := r.ListRoutesByMD5s(ctx, []string{md5Hash})
+	if err != nil {
+		return nil, err
+	}
+	return routes[md5Hash], nil
+}
+
+// ListRoutesByMD5s is the batch form of ListRoutesByMD5: it resolves the
+// existing routes for many hashes with a single query.
+// Parameters:
+//   - ctx: context for cancellation and deadlines.
+//   - md5Hashes: MD5 hashes to look up.
+//
+// Returns:
+//   - map[string][]MemeVectorRoute: existing routes keyed by MD5 hash; hashes without vectors are absent.
+//   - error: non-nil if the query fails.
+func (r *MemeVectorRepository) ListRoutesByMD5s(ctx context.Context, md5Hashes []string) (map[string][]MemeVectorRoute, error) {
+	result := make(map[string][]MemeVectorRoute, len(md5Hashes))
+	if len(md5Hashes) == 0 {
+		return result, nil
+	}
+
+	var rows []struct {
+		MD5Hash    string
+		Collection string
+		VectorType string
+	}
 	if err := r.db.WithContext(ctx).Model(&domain.MemeVector{}).
-		Where("md5_hash = ? AND collection = ? AND vector_type = ?", md5Hash, collection, normalizeVectorType(vectorType)).
-		Count(&count).Error; err != nil {
-		return false, err
+		Distinct("md5_hash", "collection", "vector_type").
+		Where("md5_hash IN ?", md5Hashes).
+		Find(&rows).Error; err != nil {
+		return nil, err
 	}
-	return count > 0, nil
+	for _, row := range rows {
+		result[row.MD5Hash] = append(result[row.MD5Hash], MemeVectorRoute{
+			Collection: row.Collection,
+			VectorType: normalizeVectorType(row.VectorType),
+		})
+	}
+	return result, nil
 }
 
 // GetByMD5AndCollection retrieves a vector record by MD5 hash and collection.
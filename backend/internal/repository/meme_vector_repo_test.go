@@ -54,11 +54,64 @@ func TestMemeVectorRepositorySeparatesVectorTypesWithinCollection(t *testing.T)
 		t.Fatalf("failed to create caption vector with same md5+collection: %v", err)
 	}
 
-	exists, err := repo.ExistsByMD5CollectionAndVectorType(ctx, "md5", "meme_caption_qwen3vl_1024", domain.MemeVectorTypeCaption)
+	found, err := repo.GetByMD5CollectionAndVectorType(ctx, "md5", "meme_caption_qwen3vl_1024", domain.MemeVectorTypeCaption)
 	if err != nil {
-		t.Fatalf("ExistsByMD5CollectionAndVectorType returned error: %v", err)
+		t.Fatalf("GetByMD5CollectionAndVectorType returned error: %v", err)
 	}
-	if !exists {
-		t.Fatal("expected caption vector to exist")
+	if found == nil || found.ID != "vector-caption" {
+		t.Fatalf("expected caption vector to exist, got %+v", found)
+	}
+}
+
+func TestMemeVectorRepositoryListRoutesByMD5(t *testing.T) {
+	t.Parallel()
+
+	db, err := gorm.Open(sqlite.Open(":memory:"), &gorm.Config{})
+	if err != nil {
+		t.Fatalf("failed to open sqlite: %v", err)
+	}
+	if err := db.AutoMigrate(&domain.MemeVector{}); err != nil {
+		t.Fatalf("failed to migrate meme_vectors: %v", err)
+	}
+
+	repo := NewMemeVectorRepository(db)
+	ctx := context.Background()
+	vectors := []domain.MemeVector{
+		{ID: "v1", MemeID: "meme-1", MD5Hash: "md5", Collection: "image_col", VectorType: domain.MemeVectorTypeImage, QdrantPointID: "p1"},
+		{ID: "v2", MemeID: "meme-1", MD5Hash: "md5", Collection: "caption_col", VectorType: domain.MemeVectorTypeCaption, QdrantPointID: "p2"},
+		{ID: "v3", MemeID: "meme-2", MD5Hash: "other", Collection: "image_col", VectorType: domain.MemeVectorTypeImage, QdrantPointID: "p3"},
+	}
+	for i := range vectors {
+		vectors[i].CreatedAt = time.Now()
+		if err := repo.Create(ctx, &vectors[i]); err != nil {
+			t.Fatalf("failed to create vector %s: %v", vectors[i].ID, err)
+		}
+	}
+
+	routes, err := repo.ListRoutesByMD5(ctx, "md5")
+	if err != nil {
+		t.Fatalf("ListRoutesByMD5 returned error: %v", err)
+	}
+	if len(routes) != 2 {
+		t.Fatalf("expected 2 routes, got %#v", routes)
+	}
+	seen := map[MemeVectorRoute]bool{}
+	for _, route := range routes {
+		seen[route] = true
+	}
+	if !seen[MemeVectorRoute{Collection: "image_col", VectorType: domain.MemeVectorTypeImage}] ||
+		!seen[MemeVectorRoute{Collection: "caption_col", VectorType: domain.MemeVectorTypeCaption}] {
+		t.Fatalf("unexpected routes: %#v", routes)
+	}
+
+	byMD5, err := repo.ListRoutesByMD5s(ctx, []string{"md5", "other", "missing"})
+	if err != nil {
+		t.Fatalf("ListRoutesByMD5s returned error: %v", err)
+	}
+	if len(byMD5["md5"]) != 2 || len(byMD5["other"]) != 1 {
+		t.Fatalf("unexpected batch routes: %#v", byMD5)
+	}
+	if _, ok := byMD5["missing"]; ok {
+		t.Fatalf("expected no routes for missing hash, got %#v", byMD5["missing"])
 	}
 }
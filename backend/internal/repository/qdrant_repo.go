@@ -24,12 +24,10 @@ const (
 
 // QdrantConnectionConfig holds configuration for Qdrant connection.
 type QdrantConnectionConfig struct {
-	Host            string
-	Port            int
-	Collection      string
-	APIKey          string // Qdrant Cloud API Key (enables TLS automatically)
-	UseTLS          bool   // Explicitly enable TLS without API Key
-	VectorDimension int    // Vector dimension for this collection (default: 1024)
+	Host   string
+	Port   int
+	APIKey string // Qdrant Cloud API Key (enables TLS automatically)
+	UseTLS bool   // Explicitly enable TLS without API Key
 }
 
 // apiKeyInterceptor creates a unary interceptor that adds API key to metadata
@@ -42,23 +40,30 @@ func apiKeyInterceptor(apiKey string) grpc.UnaryClientInterceptor {
 
 // QdrantRepository handles vector operations with Qdrant.
 type QdrantRepository struct {
-	conn            *grpc.ClientConn
 	pointsClient    pb.PointsClient
 	collectClient   pb.CollectionsClient
 	collectionName  string
 	vectorDimension int
 }
 
-// NewQdrantRepository creates a new QdrantRepository.
+// QdrantConnection is a gRPC connection to one Qdrant server that several
+// collection repositories can share. gRPC multiplexes their calls over a
+// single HTTP/2 connection, so there is one TCP/TLS handshake per server
+// instead of one per collection.
+type QdrantConnection struct {
+	conn *grpc.ClientConn
+}
+
+// NewQdrantConnection creates a shareable connection to a Qdrant server.
 // Parameters:
-//   - cfg: Qdrant connection settings including host, port, and collection.
+//   - cfg: Qdrant connection settings.
 //
 // Returns:
-//   - *QdrantRepository: initialized repository instance.
+//   - *QdrantConnection: connection for creating collection repositories.
 //   - error: non-nil if the connection cannot be established.
 //
 // Supports both local Qdrant (insecure) and Qdrant Cloud (TLS + API Key).
-func NewQdrantRepository(cfg *QdrantConnectionConfig) (*QdrantRepository, error) {
+func NewQdrantConnection(cfg *QdrantConnectionConfig) (*QdrantConnection, error) {
 	addr := fmt.Sprintf("%s:%d", cfg.Host, cfg.Port)
 
 	// Build gRPC dial options
@@ -89,28 +94,37 @@ func NewQdrantRepository(cfg *QdrantConnectionConfig) (*QdrantRepository, error)
 	if err != nil {
 		return nil, fmt.Errorf("failed to connect to qdrant: %w", err)
 	}
+	return &QdrantConnection{conn: conn}, nil
+}
 
+// Repository returns a repository for one collection on the shared connection.
+// The connection stays owned by c; close it with c.Close.
+// Parameters:
+//   - collection: Qdrant collection name.
+//   - vectorDimension: vector dimension for the collection (default: 1024).
+//
+// Returns:
+//   - *QdrantRepository: repository bound to the collection.
+func (c *QdrantConnection) Repository(collection string, vectorDimension int) *QdrantRepository {
 	// Use default dimension if not specified
-	vectorDim := cfg.VectorDimension
-	if vectorDim <= 0 {
-		vectorDim = DefaultVectorDimension
+	if vectorDimension <= 0 {
+		vectorDimension = DefaultVectorDimension
 	}
 
 	return &QdrantRepository{
-		conn:            conn,
-		pointsClient:    pb.NewPointsClient(conn),
-		collectClient:   pb.NewCollectionsClient(conn),
-		collectionName:  cfg.Collection,
-		vectorDimension: vectorDim,
-	}, nil
+		pointsClient:    pb.NewPointsClient(c.conn),
+		collectClient:   pb.NewCollectionsClient(c.conn),
+		collectionName:  collection,
+		vectorDimension: vectorDimension,
+	}
 }
 
-// Close closes the gRPC connection.
+// Close closes the shared gRPC connection.
 // Parameters: none.
 // Returns:
 //   - error: non-nil if closing the connection fails.
-func (r *QdrantRepository) Close() error {
-	return r.conn.Close()
+func (c *QdrantConnection) Close() error {
+	return c.conn.Close()
 }
 
 // EnsureCollection creates the collection if it doesn't exist.
@@ -4,6 +4,7 @@ import (
 	"context"
 	"encoding/base64"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
 	"mime"
@@ -110,7 +111,7 @@ type siliconFlowEmbeddingRequest struct {
 
 type siliconFlowEmbeddingData struct {
 	Object    string    `json:"object"`
-	Embedding []float64 `json:"embedding"`
+	Embedding []float32 `json:"embedding"`
 	Index     int       `json:"index"`
 }
 
@@ -143,7 +144,7 @@ func NewSiliconFlowEmbeddingProvider(cfg *EmbeddingProviderConfig) *SiliconFlowE
 
 	return &SiliconFlowEmbeddingProvider{
 		client:       client,
-		imageClient:  &http.Client{Timeout: 30 * time.Second},
+		imageClient:  newImageDownloadClient(),
 		baseURL:      baseURL,
 		model:        cfg.Model,
 		documentMode: normalizeEmbeddingDocumentMode(cfg.DocumentMode),
@@ -151,6 +152,24 @@ func NewSiliconFlowEmbeddingProvider(cfg *EmbeddingProviderConfig) *SiliconFlowE
 	}
 }
 
+// imageDownloadIdleConnsPerHost bounds the keep-alive pool per image host.
+// Ingest and reembed workers all download from the same CDN host, and the
+// net/http default of 2 idle connections per host forces most of them to
+// resolve and dial again after every image.
+const imageDownloadIdleConnsPerHost = 32
+
+// newImageDownloadClient returns the HTTP client used to fetch images for
+// embedding, with a keep-alive pool sized for concurrent workers.
+func newImageDownloadClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 0 // no global cap; bounded per host below
+	transport.MaxIdleConnsPerHost = imageDownloadIdleConnsPerHost
+	return &http.Client{
+		Transport: transport,
+		Timeout:   30 * time.Second,
+	}
+}
+
 func (p *SiliconFlowEmbeddingProvider) GetModel() string {
 	return p.model
 }
@@ -266,11 +285,7 @@ func (p *SiliconFlowEmbeddingProvider) embedMany(ctx context.Context, input any,
 		if item.Index < 0 || item.Index >= len(embeddings) {
 			return nil, fmt.Errorf("embedding response index out of range: %d", item.Index)
 		}
-		embedding32 := make([]float32, len(item.Embedding))
-		for i, v := range item.Embedding {
-			embedding32[i] = float32(v)
-		}
-		embeddings[item.Index] = embedding32
+		embeddings[item.Index] = item.Embedding
 	}
 
 	return embeddings, nil
@@ -313,32 +328,75 @@ func (p *SiliconFlowEmbeddingProvider) imageInput(ctx context.Context, doc Embed
 		return "", fmt.Errorf("failed to download image for SiliconFlow embedding: status %d", resp.StatusCode)
 	}
 
-	limited := io.LimitReader(resp.Body, maxSiliconFlowImageBytes+1)
-	imageData, err := io.ReadAll(limited)
+	if resp.ContentLength > maxSiliconFlowImageBytes {
+		return "", fmt.Errorf("image for SiliconFlow embedding exceeds %d bytes", maxSiliconFlowImageBytes)
+	}
+
+	// Sniff the media type from the first bytes only, then stream the rest of
+	// the body through a base64 encoder into the data URI. This avoids holding
+	// the raw image, its encoding and the concatenated URI at the same time.
+	head := make([]byte, 512)
+	n, err := io.ReadFull(resp.Body, head)
+	if err != nil && !errors.Is(err, io.EOF) && !errors.Is(err, io.ErrUnexpectedEOF) {
+		return "", fmt.Errorf("failed to read image for SiliconFlow embedding: %w", err)
+	}
+	head = head[:n]
+
+	mediaType, err := siliconFlowImageMediaType(head, resp.Header.Get("Content-Type"), imageURL)
+	if err != nil {
+		return "", err
+	}
+
+	prefix := "data:" + mediaType + ";base64,"
+	var uri strings.Builder
+	if resp.ContentLength > 0 {
+		uri.Grow(len(prefix) + base64.StdEncoding.EncodedLen(int(resp.ContentLength)))
+	}
+	uri.WriteString(prefix)
+	encoder := base64.NewEncoder(base64.StdEncoding, &uri)
+	_, _ = encoder.Write(head) // strings.Builder writes never fail
+	rest, err := io.Copy(encoder, io.LimitReader(resp.Body, maxSiliconFlowImageBytes-int64(n)+1))
 	if err != nil {
 		return "", fmt.Errorf("failed to read image for SiliconFlow embedding: %w", err)
 	}
-	if len(imageData) > maxSiliconFlowImageBytes {
+	if int64(n)+rest > maxSiliconFlowImageBytes {
 		return "", fmt.Errorf("image for SiliconFlow embedding exceeds %d bytes", maxSiliconFlowImageBytes)
 	}
+	_ = encoder.Close()
 
-	return siliconFlowImageDataURI(imageData, resp.Header.Get("Content-Type"), imageURL)
+	return uri.String(), nil
 }
 
 func siliconFlowImageDataURI(imageData []byte, mediaType, source string) (string, error) {
+	mediaType, err := siliconFlowImageMediaType(imageData, mediaType, source)
+	if err != nil {
+		return "", err
+	}
+	return "data:" + mediaType + ";base64," + base64.StdEncoding.EncodeToString(imageData), nil
+}
+
+// siliconFlowImageMediaType resolves the media type for an image data URI.
+// Only the leading bytes of the image are inspected, so callers may pass just
+// the head of a stream.
+func siliconFlowImageMediaType(imageData []byte, mediaType, source string) (string, error) {
 	if len(imageData) == 0 {
 		return "", fmt.Errorf("siliconflow image document embedding requires non-empty image data")
 	}
 
-	mediaType = normalizeImageMediaType(mediaType)
-	if mediaType == "" || !strings.HasPrefix(mediaType, "image/") {
-		mediaType = detectImageMediaType(imageData, source)
+	// Trust the magic bytes first: CDNs and object stores routinely label
+	// WebP/PNG objects as image/jpeg or application/octet-stream.
+	if sniffed := getContentType(detectImageFormat(imageData)); strings.HasPrefix(sniffed, "image/") {
+		mediaType = sniffed
+	} else {
+		mediaType = normalizeImageMediaType(mediaType)
+		if mediaType == "" || !strings.HasPrefix(mediaType, "image/") {
+			mediaType = detectImageMediaType(imageData, source)
+		}
 	}
 	if !strings.HasPrefix(mediaType, "image/") {
 		return "", fmt.Errorf("siliconflow image document embedding requires an image media type, got %q", mediaType)
 	}
-
-	return "data:" + mediaType + ";base64," + base64.StdEncoding.EncodeToString(imageData), nil
+	return mediaType, nil
 }
 
 func normalizeImageMediaType(mediaType string) string {
@@ -350,16 +408,18 @@ func normalizeImageMediaType(mediaType string) string {
 	if err != nil {
 		return strings.ToLower(mediaType)
 	}
-	return strings.ToLower(parsed)
+	// ParseMediaType already returns the type/subtype lower-cased.
+	return parsed
 }
 
 func detectImageMediaType(imageData []byte, source string) string {
-	detected := strings.ToLower(http.DetectContentType(imageData))
+	// DetectContentType only ever returns canonical lower-case types.
+	detected := http.DetectContentType(imageData)
 	if strings.HasPrefix(detected, "image/") {
 		return detected
 	}
 
-	switch strings.ToLower(filepath.Ext(source)) {
+	switch strings.ToLower(sourceExtension(source)) {
 	case ".jpg", ".jpeg":
 		return "image/jpeg"
 	case ".png":
@@ -373,6 +433,15 @@ func detectImageMediaType(imageData []byte, source string) string {
 	}
 }
 
+// sourceExtension returns the file extension of an image URL or path, ignoring
+// any query string or fragment (signed CDN URLs end in "?X-Amz-...").
+func sourceExtension(source string) string {
+	if i := strings.IndexAny(source, "?#"); i >= 0 {
+		source = source[:i]
+	}
+	return filepath.Ext(source)
+}
+
 // =============================================================================
 // Jina Embedding Provider
 // =============================================================================
@@ -587,7 +656,7 @@ type openAIEmbeddingRequest struct {
 
 type openAIEmbeddingData struct {
 	Object    string    `json:"object"`
-	Embedding []float64 `json:"embedding"`
+	Embedding []float32 `json:"embedding"`
 	Index     int       `json:"index"`
 }
 
@@ -699,16 +768,12 @@ func (p *OpenAICompatibleEmbeddingProvider) EmbedBatch(ctx context.Context, text
 		return nil, fmt.Errorf("unexpected number of embeddings: got %d, expected %d, response body: %s", len(resp.Data), len(texts), string(httpResp.Body()))
 	}
 
-	// Sort by index to ensure correct order and convert float64 to float32
+	// Sort by index to ensure correct order; vectors are decoded straight
+	// into float32, so no per-element conversion copy is needed.
 	embeddings := make([][]float32, len(texts))
 	for _, item := range resp.Data {
 		if item.Index < len(embeddings) {
-			// Convert []float64 to []float32
-			embedding32 := make([]float32, len(item.Embedding))
-			for i, v := range item.Embedding {
-				embedding32[i] = float32(v)
-			}
-			embeddings[item.Index] = embedding32
+			embeddings[item.Index] = item.Embedding
 		}
 	}
 
@@ -17,6 +17,7 @@ type EmbeddingRegistry struct {
 	configs     map[string]*config.EmbeddingConfig
 	providers   map[string]EmbeddingProvider
 	qdrantRepos map[string]*repository.QdrantRepository
+	qdrantConn  *repository.QdrantConnection // shared by every repository in qdrantRepos
 	defaultName string
 	logger      *logger.Logger
 	mu          sync.RWMutex
@@ -89,20 +90,23 @@ func NewEmbeddingRegistry(cfg *EmbeddingRegistryConfig) (*EmbeddingRegistry, err
 		// Determine collection name
 		collection := embCfg.GetCollection(cfg.DefaultCollection)
 
-		// Create Qdrant repository
-		qdrantRepo, err := repository.NewQdrantRepository(&repository.QdrantConnectionConfig{
-			Host:            cfg.QdrantHost,
-			Port:            cfg.QdrantPort,
-			Collection:      collection,
-			APIKey:          cfg.QdrantAPIKey,
-			UseTLS:          cfg.QdrantUseTLS,
-			VectorDimension: embCfg.Dimensions,
-		})
-		if err != nil {
-			logger.Warn("Failed to create Qdrant repository, skipping: name=%s, collection=%s, error=%v",
-				embCfg.Name, collection, err)
-			continue
+		// Create Qdrant repository; all collections live on the same server,
+		// so they share one connection.
+		if r.qdrantConn == nil {
+			conn, err := repository.NewQdrantConnection(&repository.QdrantConnectionConfig{
+				Host:   cfg.QdrantHost,
+				Port:   cfg.QdrantPort,
+				APIKey: cfg.QdrantAPIKey,
+				UseTLS: cfg.QdrantUseTLS,
+			})
+			if err != nil {
+				logger.Warn("Failed to create Qdrant repository, skipping: name=%s, collection=%s, error=%v",
+					embCfg.Name, collection, err)
+				continue
+			}
+			r.qdrantConn = conn
 		}
+		qdrantRepo := r.qdrantConn.Repository(collection, embCfg.Dimensions)
 
 		// Store in registry
 		r.configs[embCfg.Name] = embCfg
@@ -265,10 +269,11 @@ func (r *EmbeddingRegistry) Close() {
 	r.mu.Lock()
 	defer r.mu.Unlock()
 
-	for name, repo := range r.qdrantRepos {
-		if err := repo.Close(); err != nil {
-			logger.Warn("Error closing Qdrant repository: name=%s, error=%v", name, err)
+	if r.qdrantConn != nil {
+		if err := r.qdrantConn.Close(); err != nil {
+			logger.Warn("Error closing Qdrant connection: error=%v", err)
 		}
+		r.qdrantConn = nil
 	}
 
 	// Clear maps
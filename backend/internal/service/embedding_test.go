@@ -168,7 +168,7 @@ func TestOpenAICompatibleEmbeddingProviderEmbedDocumentUsesTextFallback(t *testi
 		}
 		return jsonResponse(t, http.StatusOK, openAIEmbeddingResponse{
 			Data: []openAIEmbeddingData{
-				{Embedding: []float64{1.0, 2.0}, Index: 0},
+				{Embedding: []float32{1.0, 2.0}, Index: 0},
 			},
 		}), nil
 	}))
@@ -213,7 +213,7 @@ func TestSiliconFlowEmbeddingProviderEmbedDocumentImageModeUsesImageDataURI(t *t
 		}
 		return jsonResponse(t, http.StatusOK, siliconFlowEmbeddingResponse{
 			Data: []siliconFlowEmbeddingData{
-				{Embedding: []float64{0.1, 0.2}, Index: 0},
+				{Embedding: []float32{0.1, 0.2}, Index: 0},
 			},
 		}), nil
 	}))
@@ -278,7 +278,7 @@ func TestSiliconFlowEmbeddingProviderEmbedDocumentImageModeDownloadsImageURL(t *
 		}
 		return jsonResponse(t, http.StatusOK, siliconFlowEmbeddingResponse{
 			Data: []siliconFlowEmbeddingData{
-				{Embedding: []float64{0.1, 0.2}, Index: 0},
+				{Embedding: []float32{0.1, 0.2}, Index: 0},
 			},
 		}), nil
 	}))
@@ -299,6 +299,74 @@ func TestSiliconFlowEmbeddingProviderEmbedDocumentImageModeDownloadsImageURL(t *
 	}
 }
 
+func TestSiliconFlowEmbeddingProviderStreamsLargeImageDownloads(t *testing.T) {
+	t.Parallel()
+
+	var got siliconFlowEmbeddingRequest
+	imageBytes := append(append([]byte{}, testPNG1x1...), bytes.Repeat([]byte{0x5a}, 4096)...)
+	imageServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/octet-stream")
+		_, _ = w.Write(imageBytes)
+	}))
+	t.Cleanup(imageServer.Close)
+
+	provider := NewSiliconFlowEmbeddingProvider(&EmbeddingProviderConfig{
+		Model:        "Qwen/Qwen3-VL-Embedding-8B",
+		APIKey:       "test-key",
+		BaseURL:      "https://siliconflow.test/v1",
+		DocumentMode: embeddingDocumentImage,
+		Dimensions:   1024,
+	})
+	provider.imageClient = imageServer.Client()
+	provider.client.SetTransport(roundTripFunc(func(r *http.Request) (*http.Response, error) {
+		if err := json.NewDecoder(r.Body).Decode(&got); err != nil {
+			t.Fatalf("failed to decode request: %v", err)
+		}
+		return jsonResponse(t, http.StatusOK, siliconFlowEmbeddingResponse{
+			Data: []siliconFlowEmbeddingData{
+				{Embedding: []float32{0.1, 0.2}, Index: 0},
+			},
+		}), nil
+	}))
+
+	if _, err := provider.EmbedDocument(context.Background(), EmbeddingDocument{
+		ImageURL: imageServer.URL + "/meme",
+	}); err != nil {
+		t.Fatalf("EmbedDocument returned error: %v", err)
+	}
+
+	input, ok := got.Input.(map[string]any)
+	if !ok {
+		t.Fatalf("expected object input, got %T", got.Input)
+	}
+	expectedImage := "data:image/png;base64," + base64.StdEncoding.EncodeToString(imageBytes)
+	if input["image"] != expectedImage {
+		t.Fatal("streamed image data URI does not match the downloaded bytes")
+	}
+}
+
+func TestSiliconFlowImageDataURIPrefersMagicBytesOverDeclaredType(t *testing.T) {
+	t.Parallel()
+
+	got, err := siliconFlowImageDataURI(testPNG1x1, "image/jpeg", "https://cdn.test/meme.jpg?x=1")
+	if err != nil {
+		t.Fatalf("siliconFlowImageDataURI returned error: %v", err)
+	}
+	expected := "data:image/png;base64," + base64.StdEncoding.EncodeToString(testPNG1x1)
+	if got != expected {
+		t.Fatalf("unexpected image input: %q", got)
+	}
+}
+
+func TestDetectImageMediaTypeIgnoresURLQueryString(t *testing.T) {
+	t.Parallel()
+
+	got := detectImageMediaType([]byte("not-an-image"), "https://cdn.test/memes/ab/abc.webp?X-Amz-Signature=deadbeef")
+	if got != "image/webp" {
+		t.Fatalf("detectImageMediaType() = %q, want image/webp", got)
+	}
+}
+
 func TestSiliconFlowEmbeddingProviderEmbedDocumentTextModeUsesTextContentAndTruncate(t *testing.T) {
 	t.Parallel()
 
@@ -316,7 +384,7 @@ func TestSiliconFlowEmbeddingProviderEmbedDocumentTextModeUsesTextContentAndTrun
 		}
 		return jsonResponse(t, http.StatusOK, siliconFlowEmbeddingResponse{
 			Data: []siliconFlowEmbeddingData{
-				{Embedding: []float64{0.3, 0.4}, Index: 0},
+				{Embedding: []float32{0.3, 0.4}, Index: 0},
 			},
 		}), nil
 	}))
@@ -1,6 +1,10 @@
 package service
 
-import "strings"
+import (
+	"strings"
+	"unicode"
+	"unicode/utf8"
+)
 
 const maxVLMEmbeddingRunes = 120
 
@@ -33,17 +37,37 @@ func normalizeOCRText(text string) string {
 	return normalizeWhitespace(trimmed)
 }
 
+// compactDescription collapses whitespace runs to single spaces and keeps at
+// most maxVLMEmbeddingRunes runes, in one pass over the input.
 func compactDescription(text string) string {
-	cleaned := normalizeWhitespace(strings.TrimSpace(text))
-	if cleaned == "" {
-		return ""
-	}
-
-	runes := []rune(cleaned)
-	if len(runes) <= maxVLMEmbeddingRunes {
-		return cleaned
+	var b strings.Builder
+	runes := 0
+	pendingSpace := false
+	for i, r := range text {
+		if unicode.IsSpace(r) {
+			pendingSpace = b.Len() > 0
+			continue
+		}
+		if pendingSpace {
+			if runes == maxVLMEmbeddingRunes {
+				break
+			}
+			b.WriteByte(' ')
+			runes++
+			pendingSpace = false
+		}
+		if runes == maxVLMEmbeddingRunes {
+			break
+		}
+		if b.Cap() == 0 {
+			b.Grow(min(len(text)-i, maxVLMEmbeddingRunes*utf8.UTFMax))
+		}
+		// range yields utf8.RuneError for invalid bytes; writing r keeps the
+		// output identical to a []rune round trip.
+		b.WriteRune(r)
+		runes++
 	}
-	return string(runes[:maxVLMEmbeddingRunes])
+	return b.String()
 }
 
 func extractEmotionWords(text string) []string {
@@ -51,14 +75,17 @@ func extractEmotionWords(text string) []string {
 		return nil
 	}
 
-	lower := strings.ToLower(text)
-	matches := make([]string, 0, len(EmotionWords))
-	for _, word := range EmotionWords {
-		if word == "" {
-			continue
-		}
-		if strings.Contains(lower, strings.ToLower(word)) {
-			matches = append(matches, word)
+	found := make([]bool, len(emotionTerms))
+	emotionMatcher.scan(strings.ToLower(text), func(idx int) bool {
+		found[idx] = true
+		return true
+	})
+
+	// Emit in lexicon order so caption text stays stable across runs.
+	matches := make([]string, 0, len(emotionTerms))
+	for i, term := range emotionTerms {
+		if found[i] {
+			matches = append(matches, term.word)
 		}
 	}
 	return dedupeStrings(matches)
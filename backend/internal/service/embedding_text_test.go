@@ -0,0 +1,36 @@
+package service
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestCompactDescriptionCollapsesWhitespaceAndTruncates(t *testing.T) {
+	t.Parallel()
+
+	// Reference behaviour: normalize whitespace, then cut to the rune limit.
+	reference := func(text string) string {
+		runes := []rune(strings.Join(strings.Fields(text), " "))
+		if len(runes) > maxVLMEmbeddingRunes {
+			runes = runes[:maxVLMEmbeddingRunes]
+		}
+		return string(runes)
+	}
+
+	cases := []string{
+		"",
+		"   \t\n ",
+		"  熊猫头   无语\n翻白眼  ",
+		strings.Repeat("哈", maxVLMEmbeddingRunes+5),
+		strings.Repeat("哈", maxVLMEmbeddingRunes-1) + " 笑",
+		strings.Repeat("哈", maxVLMEmbeddingRunes) + "   笑",
+		strings.Repeat("a b　", 100),
+		"a\xffb  \xc3\x28 c",
+		strings.Repeat("\xff", maxVLMEmbeddingRunes+5),
+	}
+	for _, text := range cases {
+		if got, want := compactDescription(text), reference(text); got != want {
+			t.Fatalf("compactDescription(%q) = %q, want %q", text, got, want)
+		}
+	}
+}
@@ -176,13 +176,17 @@ func (s *IngestService) IngestFromSource(ctx context.Context, src source.Source,
 	itemsChan := make(chan source.MemeItem, s.workers*2)
 	resultsChan := make(chan *processResult, s.workers*2)
 
+	// Content seen by any worker in this run; identical images reached via
+	// different source items are only processed once.
+	seen := newContentSet()
+
 	// Start workers
 	var wg sync.WaitGroup
 	for i := 0; i < s.workers; i++ {
 		wg.Add(1)
 		go func(workerID int) {
 			defer wg.Done()
-			s.worker(ctx, workerID, src.GetSourceID(), itemsChan, resultsChan, opts)
+			s.worker(ctx, workerID, src.GetSourceID(), itemsChan, resultsChan, seen, opts)
 		}(i)
 	}
 
@@ -267,6 +271,77 @@ func (s *IngestService) IngestFromSource(ctx context.Context, src source.Source,
 	return stats, nil
 }
 
+// contentSet records the content handled during one ingest run, keyed by
+// raw 16-byte MD5 digest (a third of the size of a hex string, and no string
+// allocation per entry). Workers share it, so it is safe for concurrent use.
+// A nil set admits everything.
+type contentSet struct {
+	mu     sync.Mutex
+	claims map[[md5.Size]byte]*contentClaim
+}
+
+// contentClaim is one worker's claim on a digest. done is closed when the
+// claimant finishes; handled is set before that and reports whether the
+// content was ingested (or already present).
+type contentClaim struct {
+	done    chan struct{}
+	handled bool
+}
+
+func newContentSet() *contentSet {
+	return &contentSet{claims: make(map[[md5.Size]byte]*contentClaim)}
+}
+
+// claim reserves digest for the caller and reports true. If another worker
+// holds it, claim waits for that worker's outcome: it reports false once the
+// content was handled, and claims the digest again if that worker failed, so
+// an identical copy is never skipped because of a failed one. A cancelled ctx
+// ends the wait with ctx.Err(). Every successful claim must be ended with
+// finish.
+func (c *contentSet) claim(ctx context.Context, digest [md5.Size]byte) (bool, error) {
+	if c == nil {
+		return true, nil
+	}
+	for {
+		c.mu.Lock()
+		held, ok := c.claims[digest]
+		if !ok {
+			c.claims[digest] = &contentClaim{done: make(chan struct{})}
+			c.mu.Unlock()
+			return true, nil
+		}
+		c.mu.Unlock()
+
+		select {
+		case <-held.done:
+		case <-ctx.Done():
+			return false, ctx.Err()
+		}
+		if held.handled {
+			return false, nil
+		}
+	}
+}
+
+// finish ends the caller's claim on digest and wakes any waiting copies.
+// Unhandled content is released so the next copy claims it.
+func (c *contentSet) finish(digest [md5.Size]byte, handled bool) {
+	if c == nil {
+		return
+	}
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	held, ok := c.claims[digest]
+	if !ok {
+		return
+	}
+	held.handled = handled
+	if !handled {
+		delete(c.claims, digest)
+	}
+	close(held.done)
+}
+
 type processResult struct {
 	sourceID string
 	skipped  bool
@@ -279,7 +354,7 @@ var errSkipDuplicate = fmt.Errorf("skipped: duplicate MD5")
 // errSkipUnsupportedImageFormat is a sentinel error for unsupported source images.
 var errSkipUnsupportedImageFormat = errors.New("skipped: unsupported image format")
 
-func (s *IngestService) worker(ctx context.Context, workerID int, sourceType string, items <-chan source.MemeItem, results chan<- *processResult, opts *IngestOptions) {
+func (s *IngestService) worker(ctx context.Context, workerID int, sourceType string, items <-chan source.MemeItem, results chan<- *processResult, seen *contentSet, opts *IngestOptions) {
 	for item := range items {
 		select {
 		case <-ctx.Done():
@@ -290,7 +365,7 @@ func (s *IngestService) worker(ctx context.Context, workerID int, sourceType str
 		result := &processResult{sourceID: item.SourceID}
 
 		// Process the item with the new multi-embedding logic
-		if err := s.processItem(ctx, sourceType, &item, opts); err != nil {
+		if err := s.processItem(ctx, sourceType, &item, seen, opts); err != nil {
 			if errors.Is(err, errSkipDuplicate) || errors.Is(err, errSkipUnsupportedImageFormat) {
 				result.skipped = true
 			} else {
@@ -302,9 +377,10 @@ func (s *IngestService) worker(ctx context.Context, workerID int, sourceType str
 	}
 }
 
-func (s *IngestService) processItem(ctx context.Context, sourceType string, item *source.MemeItem, opts *IngestOptions) error {
-	// Read image data
-	imageData, err := s.readImage(item)
+func (s *IngestService) processItem(ctx context.Context, sourceType string, item *source.MemeItem, seen *contentSet, opts *IngestOptions) (retErr error) {
+	// Read image data; digest is hashed during the read when the bytes are
+	// stored unconverted.
+	imageData, digest, hashed, err := s.readImage(item)
 	if err != nil {
 		return fmt.Errorf("failed to read image: %w", err)
 	}
@@ -331,6 +407,7 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 			actualFormat, len(imageData), len(converted))
 		imageData = converted
 		processedFormat = "jpeg"
+		hashed = false
 	} else if actualFormat != item.Format {
 		// Log when actual format differs from extension.
 		logger.CtxDebug(ctx, "Format mismatch: extension=%s, actual=%s, using actual format",
@@ -338,7 +415,23 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 	}
 
 	// Calculate MD5 hash (of the processed/converted image)
-	md5Hash := calculateMD5(imageData)
+	if !hashed {
+		digest = md5.Sum(imageData)
+	}
+	md5Hash := hex.EncodeToString(digest[:])
+	claimed, err := seen.claim(ctx, digest)
+	if err != nil {
+		return err
+	}
+	if !claimed {
+		logger.CtxDebug(ctx, "Skipping content already handled in this run: source_id=%s, md5=%s",
+			item.SourceID, md5Hash)
+		return errSkipDuplicate
+	}
+	// Copies waiting on this claim skip if it succeeds and retry if it fails.
+	defer func() {
+		seen.finish(digest, retErr == nil || errors.Is(retErr, errSkipDuplicate))
+	}()
 
 	targetIndexes, err := s.missingVectorIndexes(ctx, md5Hash, opts.Force)
 	if err != nil {
@@ -437,6 +530,7 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 		storageURL = s.storage.GetURL(storageKey)
 
 		// Create meme record (without VLM description - stored in meme_descriptions table)
+		createdAt := time.Now()
 		meme := &domain.Meme{
 			ID:         memeID,
 			SourceType: sourceType,
@@ -452,8 +546,8 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 			Tags:       item.Tags,
 			Category:   item.Category,
 			Status:     domain.MemeStatusActive,
-			CreatedAt:  time.Now(),
-			UpdatedAt:  time.Now(),
+			CreatedAt:  createdAt,
+			UpdatedAt:  createdAt,
 		}
 
 		// Save meme to database first
@@ -466,6 +560,7 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 	}
 
 	// Get or create VLM description for current VLM model
+	saveDescription := false
 	if s.descRepo != nil {
 		existingDesc, err := s.descRepo.GetByMD5AndModel(ctx, md5Hash, s.vlm.GetModel())
 		if err == nil && existingDesc != nil {
@@ -486,53 +581,48 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 			logger.CtxDebug(ctx, "Reusing existing VLM description: md5=%s, vlm_model=%s", md5Hash, s.vlm.GetModel())
 		} else {
 			// Generate new VLM description
-			vlmDescription, err = s.vlm.DescribeImage(ctx, imageData, processedFormat)
+			vlmDescription, ocrText, err = s.describeWithOCR(ctx, imageData, processedFormat, "md5="+md5Hash)
 			if err != nil {
 				rollbackMeme()
 				rollbackStorage()
-				return fmt.Errorf("failed to generate VLM description: %w", err)
-			}
-
-			ocrText, err = s.extractOCRText(ctx, imageData, processedFormat)
-			if err != nil {
-				logger.CtxWarn(ctx, "Failed to extract OCR text: md5=%s, error=%v", md5Hash, err)
-				ocrText = ""
-			}
-
-			// Save description to meme_descriptions table
-			descRecord := &domain.MemeDescription{
-				ID:          uuid.New().String(),
-				MemeID:      memeID,
-				MD5Hash:     md5Hash,
-				VLMModel:    s.vlm.GetModel(),
-				Description: vlmDescription,
-				OCRText:     ocrText,
-				CreatedAt:   time.Now(),
+				return err
 			}
-			if err := s.descRepo.Create(ctx, descRecord); err != nil {
-				rollbackMeme()
-				rollbackStorage()
-				return fmt.Errorf("failed to save VLM description: %w", err)
-			}
-			descriptionID = descRecord.ID
-			createdNewDescription = true
-			logger.CtxDebug(ctx, "Created new VLM description: md5=%s, vlm_model=%s, description_id=%s",
-				md5Hash, s.vlm.GetModel(), descriptionID)
+			saveDescription = true
 		}
 	} else {
 		// Fallback: generate VLM description without storing to database
-		vlmDescription, err = s.vlm.DescribeImage(ctx, imageData, processedFormat)
+		vlmDescription, ocrText, err = s.describeWithOCR(ctx, imageData, processedFormat, "md5="+md5Hash)
 		if err != nil {
 			rollbackMeme()
 			rollbackStorage()
-			return fmt.Errorf("failed to generate VLM description: %w", err)
+			return err
 		}
+	}
 
-		ocrText, err = s.extractOCRText(ctx, imageData, processedFormat)
-		if err != nil {
-			logger.CtxWarn(ctx, "Failed to extract OCR text: md5=%s, error=%v", md5Hash, err)
-			ocrText = ""
+	// One timestamp for the description and vector records, taken after the
+	// VLM round trips so it is not skewed by their latency.
+	now := time.Now()
+
+	if saveDescription {
+		// Save description to meme_descriptions table
+		descRecord := &domain.MemeDescription{
+			ID:          uuid.New().String(),
+			MemeID:      memeID,
+			MD5Hash:     md5Hash,
+			VLMModel:    s.vlm.GetModel(),
+			Description: vlmDescription,
+			OCRText:     ocrText,
+			CreatedAt:   now,
+		}
+		if err := s.descRepo.Create(ctx, descRecord); err != nil {
+			rollbackMeme()
+			rollbackStorage()
+			return fmt.Errorf("failed to save VLM description: %w", err)
 		}
+		descriptionID = descRecord.ID
+		createdNewDescription = true
+		logger.CtxDebug(ctx, "Created new VLM description: md5=%s, vlm_model=%s, description_id=%s",
+			md5Hash, s.vlm.GetModel(), descriptionID)
 	}
 
 	compactDesc := compactDescription(vlmDescription)
@@ -564,6 +654,7 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 		CaptionText:    captionText,
 		BM25Text:       bm25Text,
 		Payload:        payload,
+		CreatedAt:      now,
 	}); err != nil {
 		if createdNewMeme {
 			s.rollbackVectorIndexes(ctx, memeID, targetIndexes)
@@ -580,6 +671,39 @@ func (s *IngestService) processItem(ctx context.Context, sourceType string, item
 	return nil
 }
 
+// describeWithOCR runs the VLM description and OCR extraction for one image
+// concurrently. Both are independent VLM round trips, so overlapping them
+// roughly halves the per-item latency, at the cost of up to two in-flight
+// VLM requests per ingest worker. An OCR failure is logged and yields empty
+// text; a description failure cancels the OCR request and is returned.
+func (s *IngestService) describeWithOCR(ctx context.Context, imageData []byte, format, ref string) (string, string, error) {
+	ocrCtx, cancelOCR := context.WithCancel(ctx)
+	defer cancelOCR()
+
+	var ocrText string
+	var ocrErr error
+	ocrDone := make(chan struct{})
+	go func() {
+		defer close(ocrDone)
+		ocrText, ocrErr = s.extractOCRText(ocrCtx, imageData, format)
+	}()
+
+	description, err := s.vlm.DescribeImage(ctx, imageData, format)
+	if err != nil {
+		// The OCR text is useless without a description; stop paying for it.
+		cancelOCR()
+	}
+	<-ocrDone
+	if err != nil {
+		return "", "", fmt.Errorf("failed to generate VLM description: %w", err)
+	}
+	if ocrErr != nil {
+		logger.CtxWarn(ctx, "Failed to extract OCR text: %s, error=%v", ref, ocrErr)
+		ocrText = ""
+	}
+	return description, ocrText, nil
+}
+
 func (s *IngestService) extractOCRText(ctx context.Context, imageData []byte, format string) (string, error) {
 	if s.vlm == nil {
 		return "", nil
@@ -601,6 +725,7 @@ type vectorUpsertInput struct {
 	CaptionText    string
 	BM25Text       string
 	Payload        *repository.MemePayload
+	CreatedAt      time.Time // Zero means the time of the write.
 }
 
 func (s *IngestService) missingVectorIndexes(ctx context.Context, md5Hash string, force bool) ([]IngestVectorIndex, error) {
@@ -611,17 +736,38 @@ func (s *IngestService) missingVectorIndexes(ctx context.Context, md5Hash string
 		return s.indexes, nil
 	}
 
-	missing := make([]IngestVectorIndex, 0, len(s.indexes))
-	for _, index := range s.indexes {
-		exists, err := s.vectorRepo.ExistsByMD5CollectionAndVectorType(ctx, md5Hash, index.Collection, normalizeIngestVectorType(index.VectorType))
-		if err != nil {
-			return nil, fmt.Errorf("failed to check vector existence: %w", err)
-		}
-		if !exists {
+	// One query for all routes of this hash instead of one COUNT per index.
+	routes, err := s.vectorRepo.ListRoutesByMD5(ctx, md5Hash)
+	if err != nil {
+		return nil, fmt.Errorf("failed to check vector existence: %w", err)
+	}
+	return MissingVectorIndexes(s.indexes, routes), nil
+}
+
+// MissingVectorIndexes returns the indexes whose collection and vector type
+// have no stored vector among routes.
+// Parameters:
+//   - indexes: vector indexes to check.
+//   - routes: collection/vector-type pairs that already have a vector.
+//
+// Returns:
+//   - []IngestVectorIndex: indexes still to be written, in input order.
+//
+// Vector types are normalized with the ingest rule, so every caller agrees
+// on whether a route exists.
+func MissingVectorIndexes(indexes []IngestVectorIndex, routes []repository.MemeVectorRoute) []IngestVectorIndex {
+	existing := make(map[string]struct{}, len(routes))
+	for _, route := range routes {
+		existing[vectorRouteKey(route.Collection, route.VectorType)] = struct{}{}
+	}
+
+	missing := make([]IngestVectorIndex, 0, len(indexes))
+	for _, index := range indexes {
+		if _, ok := existing[vectorRouteKey(index.Collection, normalizeIngestVectorType(index.VectorType))]; !ok {
 			missing = append(missing, index)
 		}
 	}
-	return missing, nil
+	return missing
 }
 
 func (s *IngestService) upsertVectorIndexes(ctx context.Context, indexes []IngestVectorIndex, input vectorUpsertInput) error {
@@ -733,7 +879,10 @@ func (s *IngestService) upsertVectorIndex(ctx context.Context, index IngestVecto
 		DescriptionID:     input.DescriptionID,
 		QdrantPointID:     pointID,
 		Status:            domain.MemeVectorStatusActive,
-		CreatedAt:         time.Now(),
+		CreatedAt:         input.CreatedAt,
+	}
+	if vectorRecord.CreatedAt.IsZero() {
+		vectorRecord.CreatedAt = time.Now()
 	}
 
 	if vectorRecord.Dimension <= 0 {
@@ -777,17 +926,91 @@ func normalizeEmbeddingMode(mode string) string {
 	return domain.MemeVectorEmbeddingModeIndependent
 }
 
-func (s *IngestService) readImage(item *source.MemeItem) ([]byte, error) {
+// readImage returns the item's image bytes and, when hashed reports true,
+// their MD5 digest computed during the read.
+func (s *IngestService) readImage(item *source.MemeItem) (data []byte, digest [md5.Size]byte, hashed bool, err error) {
 	if item.LocalPath != "" {
-		return os.ReadFile(item.LocalPath)
+		return readImageFileWithMD5(item.LocalPath)
 	}
 	// TODO: Implement HTTP download for URL-based sources
-	return nil, fmt.Errorf("URL-based sources not implemented yet")
+	return nil, digest, false, fmt.Errorf("URL-based sources not implemented yet")
 }
 
-func calculateMD5(data []byte) string {
-	hash := md5.Sum(data)
-	return hex.EncodeToString(hash[:])
+const imageReadChunkSize = 64 * 1024
+
+// readImageFileWithMD5 reads a file into a buffer sized from its stat and
+// feeds each chunk to MD5 while it is still cache-hot, so the bytes are
+// walked once instead of read and then hashed. Formats that are converted
+// before storage are hashed after conversion, so hashing stops as soon as
+// the magic bytes identify one and hashed is returned false.
+func readImageFileWithMD5(path string) (data []byte, digest [md5.Size]byte, hashed bool, err error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, digest, false, err
+	}
+	defer file.Close()
+
+	var sizeHint int64
+	if info, err := file.Stat(); err == nil {
+		sizeHint = info.Size()
+	}
+
+	// One spare byte lets the final read observe EOF without growing.
+	data = make([]byte, 0, sizeHint+1)
+	hasher := md5.New()
+	hashing := true
+	for {
+		if len(data) == cap(data) {
+			data = append(data, 0)[:len(data)]
+		}
+		end := len(data) + imageReadChunkSize
+		if end > cap(data) {
+			end = cap(data)
+		}
+		n, err := file.Read(data[len(data):end])
+		if n > 0 {
+			start := len(data)
+			data = data[:start+n]
+			if hashing && start < 12 && len(data) >= 12 {
+				hashing = !shouldConvertStaticImageToJPEG(detectImageFormat(data))
+			}
+			if hashing {
+				hasher.Write(data[start:])
+			}
+		}
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			return nil, digest, false, err
+		}
+	}
+
+	if !hashing {
+		return data, digest, false, nil
+	}
+	hasher.Sum(digest[:0])
+	return data, digest, true, nil
+}
+
+// readAllSized reads r into a buffer pre-allocated for sizeHint bytes, so an
+// image whose size is already known is read without io.ReadAll's repeated
+// grow-and-copy. A non-positive hint falls back to io.ReadAll, and the
+// hint comes from stored metadata, so the up-front allocation is capped at
+// maxSiliconFlowImageBytes; a larger body still reads in full by growing.
+func readAllSized(r io.Reader, sizeHint int64) ([]byte, error) {
+	if sizeHint <= 0 {
+		return io.ReadAll(r)
+	}
+	if sizeHint > maxSiliconFlowImageBytes {
+		sizeHint = maxSiliconFlowImageBytes
+	}
+	// ReadFrom grows once free space drops below MinRead; reserve it up front.
+	buf := bytes.NewBuffer(make([]byte, 0, sizeHint+bytes.MinRead))
+	if _, err := buf.ReadFrom(r); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
 }
 
 func calculateSHA256(text string) string {
@@ -901,9 +1124,10 @@ func convertToJPEG(imageData []byte, format string) ([]byte, error) {
 		return nil, fmt.Errorf("failed to decode image: %w", err)
 	}
 
-	// Encode to JPEG
-	var buf bytes.Buffer
-	if err := jpeg.Encode(&buf, img, &jpeg.Options{Quality: 90}); err != nil {
+	// Encode to JPEG. Quality-90 output is usually no larger than the WebP
+	// source, so start from that size instead of growing from zero.
+	buf := bytes.NewBuffer(make([]byte, 0, len(imageData)))
+	if err := jpeg.Encode(buf, img, &jpeg.Options{Quality: 90}); err != nil {
 		return nil, fmt.Errorf("failed to encode to JPEG: %w", err)
 	}
 
@@ -930,172 +1154,184 @@ func (s *IngestService) RetryPending(ctx context.Context, limit int) (*IngestSta
 
 	stats.TotalItems = int64(len(memes))
 
-	for _, meme := range memes {
+	workers := s.workers
+	if workers < 1 {
+		workers = 1
+	}
+	if workers > len(memes) {
+		workers = len(memes)
+	}
+
+	memesChan := make(chan *domain.Meme, workers*2)
+	var wg sync.WaitGroup
+	for i := 0; i < workers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for meme := range memesChan {
+				if ctx.Err() != nil {
+					continue
+				}
+				if err := s.retryPendingMeme(ctx, meme); err != nil {
+					logger.CtxError(ctx, "Failed to retry pending meme: meme_id=%s, error=%v", meme.ID, err)
+					atomic.AddInt64(&stats.FailedItems, 1)
+					continue
+				}
+				atomic.AddInt64(&stats.ProcessedItems, 1)
+			}
+		}()
+	}
+
+feed:
+	for i := range memes {
 		select {
+		case memesChan <- &memes[i]:
 		case <-ctx.Done():
-			break
-		default:
+			break feed
 		}
+	}
+	close(memesChan)
+	wg.Wait()
 
-		targetIndexes, err := s.missingVectorIndexes(ctx, meme.MD5Hash, false)
-		if err != nil {
-			logger.CtxError(ctx, "Failed to check vector completeness: meme_id=%s, error=%v", meme.ID, err)
-			stats.FailedItems++
-			continue
-		}
-		if len(targetIndexes) == 0 {
-			meme.Status = domain.MemeStatusActive
-			meme.UpdatedAt = time.Now()
-			if err := s.memeRepo.Update(ctx, &meme); err != nil {
-				logger.CtxError(ctx, "Failed to update meme status: meme_id=%s, error=%v", meme.ID, err)
-				stats.FailedItems++
-				continue
-			}
-			stats.ProcessedItems++
-			continue
-		}
+	stats.EndTime = time.Now()
+	return stats, nil
+}
 
-		// Download from storage
-		reader, err := s.storage.Download(ctx, meme.StorageKey)
-		if err != nil {
-			logger.CtxError(ctx, "Failed to download from storage: error=%v", err)
-			stats.FailedItems++
-			continue
+// retryPendingMeme completes the missing vector routes for one pending meme
+// and marks it active.
+func (s *IngestService) retryPendingMeme(ctx context.Context, meme *domain.Meme) error {
+	targetIndexes, err := s.missingVectorIndexes(ctx, meme.MD5Hash, false)
+	if err != nil {
+		return fmt.Errorf("failed to check vector completeness: %w", err)
+	}
+	if len(targetIndexes) == 0 {
+		meme.Status = domain.MemeStatusActive
+		meme.UpdatedAt = time.Now()
+		if err := s.memeRepo.Update(ctx, meme); err != nil {
+			return fmt.Errorf("failed to update meme status: %w", err)
 		}
+		return nil
+	}
 
-		imageData, err := io.ReadAll(reader)
-		reader.Close()
-		if err != nil {
-			logger.CtxError(ctx, "Failed to read image data: error=%v", err)
-			stats.FailedItems++
-			continue
-		}
+	// Download from storage
+	reader, err := s.storage.Download(ctx, meme.StorageKey)
+	if err != nil {
+		return fmt.Errorf("failed to download from storage: %w", err)
+	}
 
-		// Get or create VLM description for current VLM model
-		var description string
-		var ocrText string
-		var descriptionID string
-		if s.descRepo != nil {
-			existingDesc, err := s.descRepo.GetByMD5AndModel(ctx, meme.MD5Hash, s.vlm.GetModel())
-			if err == nil && existingDesc != nil {
-				// Reuse existing description for this VLM model
-				description = existingDesc.Description
-				descriptionID = existingDesc.ID
-				ocrText = normalizeOCRText(existingDesc.OCRText)
-				if ocrText == "" {
-					ocrText, err = s.extractOCRText(ctx, imageData, meme.Format)
-					if err != nil {
-						logger.CtxWarn(ctx, "Failed to extract OCR text: meme_id=%s, error=%v", meme.ID, err)
-					} else if ocrText != "" {
-						if updateErr := s.descRepo.UpdateOCRText(ctx, existingDesc.ID, ocrText); updateErr != nil {
-							logger.CtxWarn(ctx, "Failed to update OCR text: description_id=%s, error=%v", existingDesc.ID, updateErr)
-						}
-					}
-				}
-				logger.CtxDebug(ctx, "Reusing existing VLM description: md5=%s, vlm_model=%s", meme.MD5Hash, s.vlm.GetModel())
-			} else {
-				// Generate new VLM description
-				description, err = s.vlm.DescribeImage(ctx, imageData, meme.Format)
-				if err != nil {
-					logger.CtxWarn(ctx, "Failed to generate VLM description: error=%v", err)
-					stats.FailedItems++
-					continue
-				}
+	imageData, err := readAllSized(reader, meme.FileSize)
+	reader.Close()
+	if err != nil {
+		return fmt.Errorf("failed to read image data: %w", err)
+	}
 
+	// Get or create VLM description for current VLM model
+	var description string
+	var ocrText string
+	var descriptionID string
+	saveDescription := false
+	if s.descRepo != nil {
+		existingDesc, err := s.descRepo.GetByMD5AndModel(ctx, meme.MD5Hash, s.vlm.GetModel())
+		if err == nil && existingDesc != nil {
+			// Reuse existing description for this VLM model
+			description = existingDesc.Description
+			descriptionID = existingDesc.ID
+			ocrText = normalizeOCRText(existingDesc.OCRText)
+			if ocrText == "" {
 				ocrText, err = s.extractOCRText(ctx, imageData, meme.Format)
 				if err != nil {
 					logger.CtxWarn(ctx, "Failed to extract OCR text: meme_id=%s, error=%v", meme.ID, err)
-					ocrText = ""
-				}
-
-				// Save description to meme_descriptions table
-				descRecord := &domain.MemeDescription{
-					ID:          uuid.New().String(),
-					MemeID:      meme.ID,
-					MD5Hash:     meme.MD5Hash,
-					VLMModel:    s.vlm.GetModel(),
-					Description: description,
-					OCRText:     ocrText,
-					CreatedAt:   time.Now(),
-				}
-				if err := s.descRepo.Create(ctx, descRecord); err != nil {
-					logger.CtxError(ctx, "Failed to save VLM description: meme_id=%s, error=%v", meme.ID, err)
-					stats.FailedItems++
-					continue
+				} else if ocrText != "" {
+					if updateErr := s.descRepo.UpdateOCRText(ctx, existingDesc.ID, ocrText); updateErr != nil {
+						logger.CtxWarn(ctx, "Failed to update OCR text: description_id=%s, error=%v", existingDesc.ID, updateErr)
+					}
 				}
-				descriptionID = descRecord.ID
-				logger.CtxDebug(ctx, "Created new VLM description: md5=%s, vlm_model=%s, description_id=%s",
-					meme.MD5Hash, s.vlm.GetModel(), descriptionID)
 			}
+			logger.CtxDebug(ctx, "Reusing existing VLM description: md5=%s, vlm_model=%s", meme.MD5Hash, s.vlm.GetModel())
 		} else {
-			// Fallback: generate VLM description without storing to database
-			var err error
-			description, err = s.vlm.DescribeImage(ctx, imageData, meme.Format)
-			if err != nil {
-				logger.CtxWarn(ctx, "Failed to generate VLM description: error=%v", err)
-				stats.FailedItems++
-				continue
-			}
-
-			ocrText, err = s.extractOCRText(ctx, imageData, meme.Format)
+			// Generate new VLM description
+			description, ocrText, err = s.describeWithOCR(ctx, imageData, meme.Format, "meme_id="+meme.ID)
 			if err != nil {
-				logger.CtxWarn(ctx, "Failed to extract OCR text: meme_id=%s, error=%v", meme.ID, err)
-				ocrText = ""
+				return err
 			}
+			saveDescription = true
 		}
-
-		compactDesc := compactDescription(description)
-		captionText := buildCaptionEmbeddingText(
-			ocrText,
-			compactDesc,
-			meme.Category,
-			meme.Tags,
-			extractEmotionWords(description),
-		)
-		bm25Text := buildBM25Text(ocrText, compactDesc, meme.Tags)
-		imageURL := s.storage.GetURL(meme.StorageKey)
-		payload := &repository.MemePayload{
-			MemeID:         meme.ID,
-			SourceType:     meme.SourceType,
-			Category:       meme.Category,
-			Tags:           meme.Tags,
-			VLMDescription: description,
-			OCRText:        ocrText,
-			StorageURL:     imageURL,
+	} else {
+		// Fallback: generate VLM description without storing to database
+		var err error
+		description, ocrText, err = s.describeWithOCR(ctx, imageData, meme.Format, "meme_id="+meme.ID)
+		if err != nil {
+			return err
 		}
+	}
 
-		if err := s.upsertVectorIndexes(ctx, targetIndexes, vectorUpsertInput{
-			MemeID:         meme.ID,
-			MD5Hash:        meme.MD5Hash,
-			DescriptionID:  descriptionID,
-			ImageURL:       imageURL,
-			ImageData:      imageData,
-			ImageMediaType: getContentType(meme.Format),
-			CaptionText:    captionText,
-			BM25Text:       bm25Text,
-			Payload:        payload,
-		}); err != nil {
-			logger.CtxError(ctx, "Failed to upsert vector indexes: meme_id=%s, error=%v", meme.ID, err)
-			stats.FailedItems++
-			continue
+	// One timestamp for every record this retry writes, taken after the VLM
+	// round trips so it is not skewed by their latency.
+	now := time.Now()
+
+	if saveDescription {
+		// Save description to meme_descriptions table
+		descRecord := &domain.MemeDescription{
+			ID:          uuid.New().String(),
+			MemeID:      meme.ID,
+			MD5Hash:     meme.MD5Hash,
+			VLMModel:    s.vlm.GetModel(),
+			Description: description,
+			OCRText:     ocrText,
+			CreatedAt:   now,
 		}
+		if err := s.descRepo.Create(ctx, descRecord); err != nil {
+			return fmt.Errorf("failed to save VLM description: %w", err)
+		}
+		descriptionID = descRecord.ID
+		logger.CtxDebug(ctx, "Created new VLM description: md5=%s, vlm_model=%s, description_id=%s",
+			meme.MD5Hash, s.vlm.GetModel(), descriptionID)
+	}
 
-		// Update meme status to active
-		meme.Status = domain.MemeStatusActive
-		meme.UpdatedAt = time.Now()
+	compactDesc := compactDescription(description)
+	captionText := buildCaptionEmbeddingText(
+		ocrText,
+		compactDesc,
+		meme.Category,
+		meme.Tags,
+		extractEmotionWords(description),
+	)
+	bm25Text := buildBM25Text(ocrText, compactDesc, meme.Tags)
+	imageURL := s.storage.GetURL(meme.StorageKey)
+	payload := &repository.MemePayload{
+		MemeID:         meme.ID,
+		SourceType:     meme.SourceType,
+		Category:       meme.Category,
+		Tags:           meme.Tags,
+		VLMDescription: description,
+		OCRText:        ocrText,
+		StorageURL:     imageURL,
+	}
 
-		if err := s.memeRepo.Update(ctx, &meme); err != nil {
-			logger.CtxError(ctx, "Failed to update database: error=%v", err)
-			stats.FailedItems++
-			continue
-		}
+	if err := s.upsertVectorIndexes(ctx, targetIndexes, vectorUpsertInput{
+		MemeID:         meme.ID,
+		MD5Hash:        meme.MD5Hash,
+		DescriptionID:  descriptionID,
+		ImageURL:       imageURL,
+		ImageData:      imageData,
+		ImageMediaType: getContentType(meme.Format),
+		CaptionText:    captionText,
+		BM25Text:       bm25Text,
+		Payload:        payload,
+		CreatedAt:      now,
+	}); err != nil {
+		return fmt.Errorf("failed to upsert vector indexes: %w", err)
+	}
 
-		logger.CtxDebug(ctx, "Retry processed: meme_id=%s, vectors=%d",
-			meme.ID, len(targetIndexes))
+	// Update meme status to active
+	meme.Status = domain.MemeStatusActive
+	meme.UpdatedAt = now
 
-		stats.ProcessedItems++
+	if err := s.memeRepo.Update(ctx, meme); err != nil {
+		return fmt.Errorf("failed to update database: %w", err)
 	}
 
-	stats.EndTime = time.Now()
-	return stats, nil
+	logger.CtxDebug(ctx, "Retry processed: meme_id=%s, vectors=%d",
+		meme.ID, len(targetIndexes))
+	return nil
 }
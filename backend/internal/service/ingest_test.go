@@ -3,6 +3,7 @@ package service
 import (
 	"bytes"
 	"context"
+	"crypto/md5"
 	"errors"
 	"fmt"
 	"io"
@@ -10,10 +11,12 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/timmy/emomo/internal/domain"
 	"github.com/timmy/emomo/internal/repository"
 	"github.com/timmy/emomo/internal/source"
+	"github.com/timmy/emomo/internal/storage"
 	"gorm.io/driver/sqlite"
 	"gorm.io/gorm"
 )
@@ -39,7 +42,7 @@ func TestProcessItemRejectsGIFMagicBytes(t *testing.T) {
 		SourceID:  "deceptive-gif",
 		LocalPath: imagePath,
 		Format:    "jpeg",
-	}, &IngestOptions{})
+	}, nil, &IngestOptions{})
 
 	if !errors.Is(err, errSkipUnsupportedImageFormat) {
 		t.Fatalf("processItem() error = %v, want errSkipUnsupportedImageFormat", err)
@@ -49,6 +52,49 @@ func TestProcessItemRejectsGIFMagicBytes(t *testing.T) {
 func TestProcessItemRollsBackNewMemeWhenVectorWriteFails(t *testing.T) {
 	t.Parallel()
 
+	db, ingest, store, imagePath := newVectorWriteFailingIngest(t)
+
+	err := ingest.processItem(context.Background(), "test", &source.MemeItem{
+		SourceID:  "new-meme",
+		LocalPath: imagePath,
+		Format:    "png",
+		Category:  "reaction",
+		Tags:      []string{"happy"},
+	}, nil, &IngestOptions{})
+	if err == nil {
+		t.Fatal("processItem() error = nil, want vector write failure")
+	}
+
+	var memeCount int64
+	if err := db.Model(&domain.Meme{}).Count(&memeCount).Error; err != nil {
+		t.Fatalf("count memes: %v", err)
+	}
+	if memeCount != 0 {
+		t.Fatalf("meme count after rollback = %d, want 0", memeCount)
+	}
+
+	var descriptionCount int64
+	if err := db.Model(&domain.MemeDescription{}).Count(&descriptionCount).Error; err != nil {
+		t.Fatalf("count descriptions: %v", err)
+	}
+	if descriptionCount != 0 {
+		t.Fatalf("description count after rollback = %d, want 0", descriptionCount)
+	}
+
+	if len(store.objects) != 0 {
+		t.Fatalf("storage objects after rollback = %d, want 0", len(store.objects))
+	}
+	if store.deleteCount != 1 {
+		t.Fatalf("storage delete count = %d, want 1", store.deleteCount)
+	}
+}
+
+// newVectorWriteFailingIngest builds an ingest service whose only vector
+// route has no Qdrant repository, so every item fails at the vector write
+// after the meme, description and upload have been created.
+func newVectorWriteFailingIngest(t *testing.T) (*gorm.DB, *IngestService, *memoryObjectStorage, string) {
+	t.Helper()
+
 	db, err := gorm.Open(sqlite.Open(":memory:"), &gorm.Config{})
 	if err != nil {
 		t.Fatalf("failed to open sqlite: %v", err)
@@ -105,38 +151,27 @@ func TestProcessItemRollsBackNewMemeWhenVectorWriteFails(t *testing.T) {
 		},
 	)
 
-	err = ingest.processItem(context.Background(), "test", &source.MemeItem{
-		SourceID:  "new-meme",
-		LocalPath: imagePath,
-		Format:    "png",
-		Category:  "reaction",
-		Tags:      []string{"happy"},
-	}, &IngestOptions{})
-	if err == nil {
-		t.Fatal("processItem() error = nil, want vector write failure")
-	}
-
-	var memeCount int64
-	if err := db.Model(&domain.Meme{}).Count(&memeCount).Error; err != nil {
-		t.Fatalf("count memes: %v", err)
-	}
-	if memeCount != 0 {
-		t.Fatalf("meme count after rollback = %d, want 0", memeCount)
-	}
+	return db, ingest, store, imagePath
+}
 
-	var descriptionCount int64
-	if err := db.Model(&domain.MemeDescription{}).Count(&descriptionCount).Error; err != nil {
-		t.Fatalf("count descriptions: %v", err)
-	}
-	if descriptionCount != 0 {
-		t.Fatalf("description count after rollback = %d, want 0", descriptionCount)
-	}
+func TestProcessItemReleasesContentClaimWhenFirstCopyFails(t *testing.T) {
+	t.Parallel()
 
-	if len(store.objects) != 0 {
-		t.Fatalf("storage objects after rollback = %d, want 0", len(store.objects))
-	}
-	if store.deleteCount != 1 {
-		t.Fatalf("storage delete count = %d, want 1", store.deleteCount)
+	_, ingest, _, imagePath := newVectorWriteFailingIngest(t)
+	seen := newContentSet()
+
+	for _, sourceID := range []string{"first-copy", "second-copy"} {
+		err := ingest.processItem(context.Background(), "test", &source.MemeItem{
+			SourceID:  sourceID,
+			LocalPath: imagePath,
+			Format:    "png",
+		}, seen, &IngestOptions{})
+		if err == nil {
+			t.Fatalf("processItem(%s) error = nil, want vector write failure", sourceID)
+		}
+		if errors.Is(err, errSkipDuplicate) {
+			t.Fatalf("processItem(%s) skipped as duplicate after the first copy failed", sourceID)
+		}
 	}
 }
 
@@ -248,3 +283,311 @@ func (s *memoryObjectStorage) Exists(_ context.Context, key string) (bool, error
 	_, ok := s.objects[key]
 	return ok, nil
 }
+
+func TestReadAllSizedReadsWholeStreamForAnyHint(t *testing.T) {
+	t.Parallel()
+
+	hints := []int64{
+		int64(len(testPNG1x1)),
+		0,
+		-1,
+		1,
+		1 << 40, // corrupt metadata must not trigger a huge allocation
+	}
+	for _, hint := range hints {
+		data, err := readAllSized(bytes.NewReader(testPNG1x1), hint)
+		if err != nil {
+			t.Fatalf("readAllSized(hint=%d) error = %v", hint, err)
+		}
+		if !bytes.Equal(data, testPNG1x1) {
+			t.Fatalf("readAllSized(hint=%d) = %v, want %v", hint, data, testPNG1x1)
+		}
+	}
+}
+
+func TestReadImageFileWithMD5HashesWhileReading(t *testing.T) {
+	t.Parallel()
+
+	dir := t.TempDir()
+	large := bytes.Repeat(testPNG1x1, imageReadChunkSize/len(testPNG1x1)+3)
+	pngPath := filepath.Join(dir, "large.png")
+	if err := os.WriteFile(pngPath, large, 0o644); err != nil {
+		t.Fatalf("WriteFile() error = %v", err)
+	}
+
+	data, digest, hashed, err := readImageFileWithMD5(pngPath)
+	if err != nil {
+		t.Fatalf("readImageFileWithMD5() error = %v", err)
+	}
+	if !bytes.Equal(data, large) {
+		t.Fatalf("readImageFileWithMD5() returned %d bytes, want %d", len(data), len(large))
+	}
+	if want := md5.Sum(large); !hashed || digest != want {
+		t.Fatalf("readImageFileWithMD5() md5 = %x (hashed=%v), want %x", digest, hashed, want)
+	}
+
+	webp := []byte("RIFF\x00\x00\x00\x00WEBPVP8 ")
+	webpPath := filepath.Join(dir, "converted.webp")
+	if err := os.WriteFile(webpPath, webp, 0o644); err != nil {
+		t.Fatalf("WriteFile() error = %v", err)
+	}
+	data, _, hashed, err = readImageFileWithMD5(webpPath)
+	if err != nil {
+		t.Fatalf("readImageFileWithMD5() error = %v", err)
+	}
+	if !bytes.Equal(data, webp) || hashed {
+		t.Fatalf("readImageFileWithMD5() = %q, hashed=%v, want webp bytes and no digest", data, hashed)
+	}
+}
+
+func TestContentSetAdmitsEachHashOnce(t *testing.T) {
+	t.Parallel()
+
+	ctx := context.Background()
+	first := md5.Sum([]byte("first"))
+	second := md5.Sum([]byte("second"))
+
+	seen := newContentSet()
+	if claimed, err := seen.claim(ctx, first); err != nil || !claimed {
+		t.Fatalf("claim(first) = %v, %v on first sighting, want true", claimed, err)
+	}
+	seen.finish(first, true)
+	if claimed, err := seen.claim(ctx, first); err != nil || claimed {
+		t.Fatalf("claim(first) = %v, %v after it was handled, want false", claimed, err)
+	}
+	if claimed, err := seen.claim(ctx, second); err != nil || !claimed {
+		t.Fatalf("claim(second) = %v, %v, want true", claimed, err)
+	}
+	seen.finish(second, false)
+	if claimed, err := seen.claim(ctx, second); err != nil || !claimed {
+		t.Fatalf("claim(second) = %v, %v after a failed copy, want true", claimed, err)
+	}
+
+	var unset *contentSet
+	for i := 0; i < 2; i++ {
+		if claimed, err := unset.claim(ctx, first); err != nil || !claimed {
+			t.Fatal("nil contentSet rejected a hash, want every hash admitted")
+		}
+	}
+}
+
+func TestContentSetConcurrentCopyWaitsForClaimant(t *testing.T) {
+	t.Parallel()
+
+	ctx := context.Background()
+	digest := md5.Sum([]byte("shared"))
+	seen := newContentSet()
+	if claimed, err := seen.claim(ctx, digest); err != nil || !claimed {
+		t.Fatalf("claim() = %v, %v for the first copy, want true", claimed, err)
+	}
+
+	type claimResult struct {
+		claimed bool
+		err     error
+	}
+	waiting := make(chan claimResult, 1)
+	go func() {
+		claimed, err := seen.claim(ctx, digest)
+		waiting <- claimResult{claimed, err}
+	}()
+	select {
+	case got := <-waiting:
+		t.Fatalf("concurrent claim() = %+v while the first copy was in flight, want it to wait", got)
+	case <-time.After(20 * time.Millisecond):
+	}
+
+	// The first copy fails: the waiting copy takes over instead of skipping.
+	seen.finish(digest, false)
+	if got := <-waiting; got.err != nil || !got.claimed {
+		t.Fatalf("concurrent claim() = %+v after the first copy failed, want true", got)
+	}
+
+	go func() {
+		claimed, err := seen.claim(ctx, digest)
+		waiting <- claimResult{claimed, err}
+	}()
+	// The second copy succeeds: the next one skips.
+	seen.finish(digest, true)
+	if got := <-waiting; got.err != nil || got.claimed {
+		t.Fatalf("concurrent claim() = %+v after the content was handled, want false", got)
+	}
+
+	held := md5.Sum([]byte("held"))
+	if claimed, err := seen.claim(ctx, held); err != nil || !claimed {
+		t.Fatalf("claim(held) = %v, %v, want true", claimed, err)
+	}
+	canceled, cancel := context.WithCancel(ctx)
+	cancel()
+	if _, err := seen.claim(canceled, held); !errors.Is(err, context.Canceled) {
+		t.Fatalf("claim() with cancelled context error = %v, want context.Canceled", err)
+	}
+}
+
+func TestDescribeWithOCRCancelsOCRWhenDescriptionFails(t *testing.T) {
+	t.Parallel()
+
+	ocrCanceled := make(chan struct{})
+	vlm := NewVLMService(&VLMConfig{
+		Model:   "test-vlm",
+		APIKey:  "test-key",
+		BaseURL: "https://vlm.test/v1",
+	})
+	vlm.client.SetTransport(roundTripFunc(func(r *http.Request) (*http.Response, error) {
+		body, err := io.ReadAll(r.Body)
+		if err != nil {
+			return nil, err
+		}
+		if !bytes.Contains(body, []byte(vlmOCRSystemPrompt)) {
+			return jsonResponse(t, http.StatusInternalServerError, map[string]string{"error": "boom"}), nil
+		}
+		select {
+		case <-r.Context().Done():
+			close(ocrCanceled)
+			return nil, r.Context().Err()
+		case <-time.After(5 * time.Second):
+			return nil, errors.New("OCR request was not canceled")
+		}
+	}))
+	ingest := &IngestService{vlm: vlm}
+
+	if _, _, err := ingest.describeWithOCR(context.Background(), testPNG1x1, "png", "test"); err == nil {
+		t.Fatal("describeWithOCR() error = nil, want description failure")
+	}
+	select {
+	case <-ocrCanceled:
+	default:
+		t.Fatal("describeWithOCR() returned without canceling the OCR request")
+	}
+}
+
+// cancelOnDownloadStorage cancels the retry run on its first download, as an
+// interrupted admin request would.
+type cancelOnDownloadStorage struct {
+	*memoryObjectStorage
+	cancel context.CancelFunc
+}
+
+func (s *cancelOnDownloadStorage) Download(ctx context.Context, _ string) (io.ReadCloser, error) {
+	s.cancel()
+	return nil, ctx.Err()
+}
+
+// newRetryPendingIngest stores pendingMemes as pending memes. Those listed in
+// embedded already have every vector route, so a retry only activates them.
+func newRetryPendingIngest(t *testing.T, objectStorage storage.ObjectStorage, workers int, pendingMemes []string, embedded ...string) (*gorm.DB, *IngestService) {
+	t.Helper()
+
+	db, err := gorm.Open(sqlite.Open(":memory:"), &gorm.Config{})
+	if err != nil {
+		t.Fatalf("failed to open sqlite: %v", err)
+	}
+	sqlDB, err := db.DB()
+	if err != nil {
+		t.Fatalf("failed to get sql.DB: %v", err)
+	}
+	// Retry workers run concurrently; keep them on the one in-memory database.
+	sqlDB.SetMaxOpenConns(1)
+	if err := db.AutoMigrate(&domain.Meme{}, &domain.MemeVector{}, &domain.MemeDescription{}); err != nil {
+		t.Fatalf("failed to migrate test database: %v", err)
+	}
+
+	ctx := context.Background()
+	memeRepo := repository.NewMemeRepository(db)
+	vectorRepo := repository.NewMemeVectorRepository(db)
+	for _, id := range pendingMemes {
+		meme := &domain.Meme{
+			ID:         id,
+			SourceType: "test",
+			SourceID:   id,
+			MD5Hash:    "md5-" + id,
+			StorageKey: "memes/" + id + ".png",
+			Format:     "png",
+			Status:     domain.MemeStatusPending,
+		}
+		if err := memeRepo.Create(ctx, meme); err != nil {
+			t.Fatalf("failed to create meme %s: %v", id, err)
+		}
+	}
+	for i, id := range embedded {
+		vector := &domain.MemeVector{
+			ID:            "vector-" + id,
+			MemeID:        id,
+			MD5Hash:       "md5-" + id,
+			Collection:    "retry_collection",
+			VectorType:    domain.MemeVectorTypeImage,
+			QdrantPointID: fmt.Sprintf("point-%d", i),
+			Status:        domain.MemeVectorStatusActive,
+			CreatedAt:     time.Now(),
+		}
+		if err := vectorRepo.Create(ctx, vector); err != nil {
+			t.Fatalf("failed to create vector for %s: %v", id, err)
+		}
+	}
+
+	ingest := NewIngestService(
+		memeRepo,
+		vectorRepo,
+		repository.NewMemeDescriptionRepository(db),
+		nil,
+		objectStorage,
+		nil,
+		nil,
+		nil,
+		&IngestConfig{
+			Workers: workers,
+			VectorIndexes: []IngestVectorIndex{
+				{VectorType: domain.MemeVectorTypeImage, Collection: "retry_collection"},
+			},
+		},
+	)
+	return db, ingest
+}
+
+func TestRetryPendingCountsProcessedAndFailedAcrossWorkers(t *testing.T) {
+	t.Parallel()
+
+	// Embedded memes only need activating; the others fail to download
+	// because the store is empty.
+	db, ingest := newRetryPendingIngest(t, newMemoryObjectStorage(), 3,
+		[]string{"done-1", "done-2", "done-3", "missing-1", "missing-2"},
+		"done-1", "done-2", "done-3")
+
+	stats, err := ingest.RetryPending(context.Background(), 10)
+	if err != nil {
+		t.Fatalf("RetryPending() error = %v", err)
+	}
+	if stats.TotalItems != 5 || stats.ProcessedItems != 3 || stats.FailedItems != 2 {
+		t.Fatalf("RetryPending() stats = total %d, processed %d, failed %d; want 5, 3, 2",
+			stats.TotalItems, stats.ProcessedItems, stats.FailedItems)
+	}
+
+	var active int64
+	if err := db.Model(&domain.Meme{}).Where("status = ?", domain.MemeStatusActive).Count(&active).Error; err != nil {
+		t.Fatalf("failed to count active memes: %v", err)
+	}
+	if active != 3 {
+		t.Fatalf("active memes = %d, want 3", active)
+	}
+}
+
+func TestRetryPendingStopsDispatchWhenCancelled(t *testing.T) {
+	t.Parallel()
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	objectStorage := &cancelOnDownloadStorage{memoryObjectStorage: newMemoryObjectStorage(), cancel: cancel}
+	_, ingest := newRetryPendingIngest(t, objectStorage, 1,
+		[]string{"meme-1", "meme-2", "meme-3", "meme-4", "meme-5"})
+
+	stats, err := ingest.RetryPending(ctx, 10)
+	if err != nil {
+		t.Fatalf("RetryPending() error = %v", err)
+	}
+	// Only the meme in flight when the run was cancelled is attempted. The
+	// old serial loop's break only left its select, so every remaining meme
+	// was still tried with the dead context and counted as failed.
+	if stats.ProcessedItems != 0 || stats.FailedItems != 1 {
+		t.Fatalf("RetryPending() after cancel = processed %d, failed %d; want 0, 1",
+			stats.ProcessedItems, stats.FailedItems)
+	}
+}
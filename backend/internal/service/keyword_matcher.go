@@ -0,0 +1,97 @@
+package service
+
+// keywordMatcher finds every occurrence of a fixed set of keywords in a
+// single left-to-right pass over the input (Aho-Corasick). It replaces
+// per-keyword strings.Contains scans, which cost O(len(text) * keywords).
+//
+// Transitions are stored densely per state and already fold in the failure
+// links, so scanning costs one array index per input byte. The lexicons here
+// build a few hundred states (about 1KB each).
+//
+// Matching is byte-wise; because both keywords and text are valid UTF-8, a
+// byte match always lines up on rune boundaries.
+type keywordMatcher struct {
+	next [][256]int32
+	// out lists the keyword indexes recognised at each state, including the
+	// ones inherited through failure links.
+	out [][]int
+}
+
+// newKeywordMatcher builds a matcher for keywords. Empty keywords are ignored.
+// Keyword indexes reported by the matcher refer to positions in keywords.
+func newKeywordMatcher(keywords []string) *keywordMatcher {
+	m := &keywordMatcher{
+		next: make([][256]int32, 1),
+		out:  [][]int{nil},
+	}
+
+	// Build the keyword trie; state 0 is the root, so a zero transition means
+	// "no child yet".
+	for idx, keyword := range keywords {
+		if keyword == "" {
+			continue
+		}
+		state := int32(0)
+		for i := 0; i < len(keyword); i++ {
+			child := m.next[state][keyword[i]]
+			if child == 0 {
+				child = int32(len(m.next))
+				m.next = append(m.next, [256]int32{})
+				m.out = append(m.out, nil)
+				m.next[state][keyword[i]] = child
+			}
+			state = child
+		}
+		m.out[state] = append(m.out[state], idx)
+	}
+
+	// Breadth-first pass: wire failure links and fill every missing
+	// transition with the one its failure state takes.
+	fail := make([]int32, len(m.next))
+	queue := make([]int32, 0, len(m.next))
+	for b := 0; b < 256; b++ {
+		if child := m.next[0][b]; child != 0 {
+			queue = append(queue, child)
+		}
+	}
+	for len(queue) > 0 {
+		state := queue[0]
+		queue = queue[1:]
+		m.out[state] = append(m.out[state], m.out[fail[state]]...)
+		for b := 0; b < 256; b++ {
+			child := m.next[state][b]
+			if child == 0 {
+				m.next[state][b] = m.next[fail[state]][b]
+				continue
+			}
+			fail[child] = m.next[fail[state]][b]
+			queue = append(queue, child)
+		}
+	}
+	return m
+}
+
+// scan reports each keyword index matched in text to visit, in match order.
+// A keyword occurring several times is reported several times. Scanning stops
+// early when visit returns false.
+func (m *keywordMatcher) scan(text string, visit func(idx int) bool) {
+	state := int32(0)
+	for i := 0; i < len(text); i++ {
+		state = m.next[state][text[i]]
+		for _, idx := range m.out[state] {
+			if !visit(idx) {
+				return
+			}
+		}
+	}
+}
+
+// matchAny reports whether text contains at least one keyword.
+func (m *keywordMatcher) matchAny(text string) bool {
+	found := false
+	m.scan(text, func(int) bool {
+		found = true
+		return false
+	})
+	return found
+}
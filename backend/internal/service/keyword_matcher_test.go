@@ -0,0 +1,97 @@
+package service
+
+import (
+	"reflect"
+	"sort"
+	"strings"
+	"testing"
+)
+
+func TestKeywordMatcherFindsOverlappingKeywords(t *testing.T) {
+	t.Parallel()
+
+	matcher := newKeywordMatcher([]string{"he", "she", "his", "hers", ""})
+
+	var got []int
+	matcher.scan("ushers", func(idx int) bool {
+		got = append(got, idx)
+		return true
+	})
+	sort.Ints(got)
+
+	if want := []int{0, 1, 3}; !reflect.DeepEqual(got, want) {
+		t.Fatalf("matched keyword indexes = %v, want %v", got, want)
+	}
+}
+
+func TestKeywordMatcherMatchesMultibyteKeywords(t *testing.T) {
+	t.Parallel()
+
+	matcher := newKeywordMatcher([]string{"无语", "蚌埠住了", "emo"})
+
+	if !matcher.matchAny("这也太蚌埠住了吧") {
+		t.Fatal("expected multibyte keyword match")
+	}
+	if matcher.matchAny("无聊的一天") {
+		t.Fatal("expected no match for a shared prefix only")
+	}
+}
+
+func TestKeywordMatcherAgreesWithSubstringScan(t *testing.T) {
+	t.Parallel()
+
+	texts := []string{
+		"熊猫头一脸无语又尴尬，阴阳怪气地嘲讽",
+		"emo了，真的破防裂开",
+		"一只普通的猫",
+	}
+	for _, text := range texts {
+		var want []string
+		for _, term := range emotionTerms {
+			if strings.Contains(text, term.lower) {
+				want = append(want, term.word)
+			}
+		}
+		if got := extractEmotionWords(text); !reflect.DeepEqual(got, dedupeStrings(want)) {
+			t.Fatalf("extractEmotionWords(%q) = %v, want %v", text, got, want)
+		}
+	}
+}
+
+// keywordBenchmarkTexts are a typical VLM description and a short search
+// query, used to compare the matcher with the per-keyword strings.Contains
+// loop it replaced.
+var keywordBenchmarkTexts = []struct {
+	name string
+	text string
+}{
+	{"description", "一只熊猫头表情包，满脸无语地看着镜头，配文“我不理解”，表情嫌弃又无奈，透着一股摆烂的emo气息，适合表达破防和崩溃的心情"},
+	{"query", "熊猫头 无奈"},
+}
+
+func BenchmarkKeywordMatcherScan(b *testing.B) {
+	for _, tc := range keywordBenchmarkTexts {
+		b.Run(tc.name, func(b *testing.B) {
+			for i := 0; i < b.N; i++ {
+				extractEmotionWords(tc.text)
+			}
+		})
+	}
+}
+
+func BenchmarkKeywordContainsLoop(b *testing.B) {
+	for _, tc := range keywordBenchmarkTexts {
+		b.Run(tc.name, func(b *testing.B) {
+			for i := 0; i < b.N; i++ {
+				lower := strings.ToLower(tc.text)
+				matches := make([]string, 0, len(emotionTerms))
+				for _, term := range emotionTerms {
+					if strings.Contains(lower, term.lower) {
+						matches = append(matches, term.word)
+					}
+				}
+				dedupeStrings(matches)
+			}
+		})
+	}
+}
@@ -2,6 +2,7 @@ package service
 
 import (
 	"bufio"
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -49,11 +50,12 @@ const (
 
 // QueryExpansionService handles query expansion using an LLM.
 type QueryExpansionService struct {
-	client   *resty.Client
-	model    string
-	endpoint string
-	apiKey   string
-	enabled  bool
+	client       *resty.Client
+	streamClient *http.Client // shared by ExpandStream calls
+	model        string
+	endpoint     string
+	apiKey       string
+	enabled      bool
 }
 
 // QueryExpansionConfig holds configuration for query expansion service.
@@ -86,11 +88,12 @@ func NewQueryExpansionService(cfg *QueryExpansionConfig) *QueryExpansionService
 	endpoint := baseURL + "/chat/completions"
 
 	return &QueryExpansionService{
-		client:   client,
-		model:    cfg.Model,
-		endpoint: endpoint,
-		apiKey:   cfg.APIKey,
-		enabled:  true,
+		client:       client,
+		streamClient: &http.Client{Timeout: 30 * time.Second},
+		model:        cfg.Model,
+		endpoint:     endpoint,
+		apiKey:       cfg.APIKey,
+		enabled:      true,
 	}
 }
 
@@ -145,6 +148,12 @@ type streamDelta struct {
 	} `json:"choices"`
 }
 
+// SSE framing tokens matched against raw stream lines.
+var (
+	sseDataPrefix = []byte("data: ")
+	sseDoneMarker = []byte("[DONE]")
+)
+
 // Expand expands a short query into a richer semantic description.
 // Parameters:
 //   - ctx: context for cancellation and deadlines.
@@ -158,7 +167,7 @@ func (s *QueryExpansionService) Expand(ctx context.Context, query string) (strin
 	}
 
 	// Skip expansion for already long queries (likely already descriptive)
-	if len([]rune(query)) > 50 {
+	if runeCount(query) > 50 {
 		return query, nil
 	}
 
@@ -204,7 +213,7 @@ func (s *QueryExpansionService) Expand(ctx context.Context, query string) (strin
 	expanded := strings.TrimSpace(resp.Choices[0].Message.Content)
 
 	// Validate expansion - if it's too short or seems invalid, return original
-	if len([]rune(expanded)) < 10 {
+	if runeCount(expanded) < 10 {
 		return query, nil
 	}
 
@@ -241,7 +250,7 @@ func (s *QueryExpansionService) ExpandStream(ctx context.Context, query string,
 	}
 
 	// Skip expansion for already long queries
-	if len([]rune(query)) > 50 {
+	if runeCount(query) > 50 {
 		return query, nil
 	}
 
@@ -268,7 +277,7 @@ func (s *QueryExpansionService) ExpandStream(ctx context.Context, query string,
 	}
 
 	// Create HTTP request manually for streaming
-	httpReq, err := http.NewRequestWithContext(ctx, "POST", s.endpoint, strings.NewReader(string(reqBody)))
+	httpReq, err := http.NewRequestWithContext(ctx, "POST", s.endpoint, bytes.NewReader(reqBody))
 	if err != nil {
 		return query, fmt.Errorf("failed to create request: %w", err)
 	}
@@ -277,8 +286,7 @@ func (s *QueryExpansionService) ExpandStream(ctx context.Context, query string,
 	httpReq.Header.Set("Authorization", "Bearer "+s.apiKey)
 	httpReq.Header.Set("Accept", "text/event-stream")
 
-	client := &http.Client{Timeout: 30 * time.Second}
-	resp, err := client.Do(httpReq)
+	resp, err := s.streamClient.Do(httpReq)
 	if err != nil {
 		return query, fmt.Errorf("stream request failed: %w", err)
 	}
@@ -294,25 +302,25 @@ func (s *QueryExpansionService) ExpandStream(ctx context.Context, query string,
 	scanner := bufio.NewScanner(resp.Body)
 
 	for scanner.Scan() {
-		line := scanner.Text()
+		// Work on the scanner's buffer directly: no per-line string copy,
+		// and the JSON payload is decoded from the same bytes.
+		line := scanner.Bytes()
 
 		// Skip empty lines and comments
-		if line == "" || strings.HasPrefix(line, ":") {
+		if len(line) == 0 || line[0] == ':' {
 			continue
 		}
 
 		// Parse data lines
-		if strings.HasPrefix(line, "data: ") {
-			data := strings.TrimPrefix(line, "data: ")
-
+		if data, ok := bytes.CutPrefix(line, sseDataPrefix); ok {
 			// Check for stream end
-			if data == "[DONE]" {
+			if bytes.Equal(data, sseDoneMarker) {
 				break
 			}
 
 			// Parse JSON delta
 			var delta streamDelta
-			if err := json.Unmarshal([]byte(data), &delta); err != nil {
+			if err := json.Unmarshal(data, &delta); err != nil {
 				continue // Skip malformed data
 			}
 
@@ -331,7 +339,7 @@ func (s *QueryExpansionService) ExpandStream(ctx context.Context, query string,
 	expanded := strings.TrimSpace(fullContent.String())
 
 	// Validate expansion
-	if len([]rune(expanded)) < 10 {
+	if runeCount(expanded) < 10 {
 		return query, nil
 	}
 
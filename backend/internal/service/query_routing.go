@@ -3,6 +3,7 @@ package service
 import (
 	"strings"
 	"unicode"
+	"unicode/utf8"
 
 	"github.com/timmy/emomo/internal/repository"
 )
@@ -84,7 +85,7 @@ func clampPrefetch(limit int) int {
 }
 
 func runeCount(text string) int {
-	return len([]rune(text))
+	return utf8.RuneCountInString(text)
 }
 
 func hasQuote(text string) bool {
@@ -101,22 +102,5 @@ func containsDigit(text string) bool {
 }
 
 func containsIntentKeyword(text string) bool {
-	lower := strings.ToLower(text)
-	for _, word := range EmotionWords {
-		if word == "" {
-			continue
-		}
-		if strings.Contains(lower, strings.ToLower(word)) {
-			return true
-		}
-	}
-	for _, word := range InternetMemes {
-		if word == "" {
-			continue
-		}
-		if strings.Contains(lower, strings.ToLower(word)) {
-			return true
-		}
-	}
-	return false
+	return intentMatcher.matchAny(strings.ToLower(text))
 }
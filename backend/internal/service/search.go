@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"sort"
+	"sync"
 
 	"github.com/timmy/emomo/internal/domain"
 	"github.com/timmy/emomo/internal/logger"
@@ -475,14 +476,9 @@ func (s *SearchService) searchProfile(
 	logger.CtxInfo(ctx, "Performing profile search: query=%q, query_for_embedding=%q, top_k=%d, profile=%s",
 		originalQuery, queryForEmbedding, req.TopK, profileName)
 
-	imageQueryEmbedding, err := profile.Image.Embedding.EmbedQuery(ctx, queryForEmbedding)
+	imageQueryEmbedding, captionQueryEmbedding, err := embedProfileQuery(ctx, profile, queryForEmbedding)
 	if err != nil {
-		return nil, fmt.Errorf("failed to generate image route query embedding: %w", err)
-	}
-
-	captionQueryEmbedding, err := profile.Caption.Embedding.EmbedQuery(ctx, queryForEmbedding)
-	if err != nil {
-		return nil, fmt.Errorf("failed to generate caption route query embedding: %w", err)
+		return nil, err
 	}
 
 	filters := &repository.SearchFilters{
@@ -490,19 +486,33 @@ func (s *SearchService) searchProfile(
 		SourceType: req.SourceType,
 	}
 
+	// The three routes are independent Qdrant queries; run them together so
+	// the search waits for the slowest route instead of the sum of all three.
+	var captionResults, keywordResults []repository.SearchResult
+	var captionErr, keywordErr error
+	var routes sync.WaitGroup
+	routes.Add(2)
+	go func() {
+		defer routes.Done()
+		captionResults, captionErr = profile.Caption.QdrantRepo.Search(ctx, captionQueryEmbedding, s.retrieval.CaptionTopK, filters)
+	}()
+	go func() {
+		defer routes.Done()
+		keywordResults, keywordErr = profile.Caption.QdrantRepo.SparseSearch(ctx, originalQuery, s.retrieval.CaptionTopK, filters)
+	}()
 	imageResults, imageErr := profile.Image.QdrantRepo.Search(ctx, imageQueryEmbedding, s.retrieval.ImageTopK, filters)
+	routes.Wait()
+
 	if imageErr != nil {
 		logger.CtxWarn(ctx, "Profile image search failed: profile=%s, error=%v", profileName, imageErr)
 		imageResults = nil
 	}
 
-	captionResults, captionErr := profile.Caption.QdrantRepo.Search(ctx, captionQueryEmbedding, s.retrieval.CaptionTopK, filters)
 	if captionErr != nil {
 		logger.CtxWarn(ctx, "Profile caption search failed: profile=%s, error=%v", profileName, captionErr)
 		captionResults = nil
 	}
 
-	keywordResults, keywordErr := profile.Caption.QdrantRepo.SparseSearch(ctx, originalQuery, s.retrieval.CaptionTopK, filters)
 	if keywordErr != nil {
 		logger.CtxWarn(ctx, "Profile keyword search failed: profile=%s, error=%v", profileName, keywordErr)
 		keywordResults = nil
@@ -528,6 +538,28 @@ func (s *SearchService) searchProfile(
 	}, nil
 }
 
+// embedProfileQuery embeds the query for the image and caption routes
+// concurrently; the two provider calls are independent network round trips.
+func embedProfileQuery(ctx context.Context, profile *SearchProfileConfig, query string) ([]float32, []float32, error) {
+	var captionEmbedding []float32
+	var captionErr error
+	captionDone := make(chan struct{})
+	go func() {
+		defer close(captionDone)
+		captionEmbedding, captionErr = profile.Caption.Embedding.EmbedQuery(ctx, query)
+	}()
+
+	imageEmbedding, err := profile.Image.Embedding.EmbedQuery(ctx, query)
+	<-captionDone
+	if err != nil {
+		return nil, nil, fmt.Errorf("failed to generate image route query embedding: %w", err)
+	}
+	if captionErr != nil {
+		return nil, nil, fmt.Errorf("failed to generate caption route query embedding: %w", captionErr)
+	}
+	return imageEmbedding, captionEmbedding, nil
+}
+
 type routeResults struct {
 	results []repository.SearchResult
 	weight  float32
@@ -549,11 +581,21 @@ func fuseProfileResults(
 		{results: keywordResults, weight: weights.Keyword},
 	}
 
+	total := 0
+	for _, route := range routes {
+		if route.weight > 0 {
+			total += len(route.results)
+		}
+	}
+
+	// Accumulate into a flat slice indexed by meme ID: one allocation for all
+	// candidates instead of one heap object per meme plus a copy-out pass.
 	type scoredResult struct {
 		result SearchResult
 		score  float32
 	}
-	byMemeID := make(map[string]*scoredResult)
+	items := make([]scoredResult, 0, total)
+	indexByMemeID := make(map[string]int, total)
 	maxScore := float32(0)
 	for _, route := range routes {
 		if route.weight <= 0 {
@@ -564,9 +606,11 @@ func fuseProfileResults(
 				continue
 			}
 			rankScore := route.weight * (1 / float32(rank+60))
-			item, ok := byMemeID[qr.Payload.MemeID]
+			idx, ok := indexByMemeID[qr.Payload.MemeID]
 			if !ok {
-				item = &scoredResult{
+				idx = len(items)
+				indexByMemeID[qr.Payload.MemeID] = idx
+				items = append(items, scoredResult{
 					result: SearchResult{
 						ID:          qr.Payload.MemeID,
 						URL:         qr.Payload.StorageURL,
@@ -574,24 +618,23 @@ func fuseProfileResults(
 						Category:    qr.Payload.Category,
 						Tags:        qr.Payload.Tags,
 					},
-				}
-				byMemeID[qr.Payload.MemeID] = item
+				})
 			}
-			item.score += rankScore
-			if item.score > maxScore {
-				maxScore = item.score
+			items[idx].score += rankScore
+			if items[idx].score > maxScore {
+				maxScore = items[idx].score
 			}
 		}
 	}
 
-	items := make([]scoredResult, 0, len(byMemeID))
-	for _, item := range byMemeID {
-		if maxScore > 0 {
-			item.result.Score = item.score / maxScore
+	if maxScore > 0 {
+		for i := range items {
+			items[i].result.Score = items[i].score / maxScore
 		}
-		items = append(items, *item)
 	}
-	sort.SliceStable(items, func(i, j int) bool {
+	// IDs are unique, so the tie-break makes the order total and a stable sort
+	// is unnecessary.
+	sort.Slice(items, func(i, j int) bool {
 		if items[i].result.Score == items[j].result.Score {
 			return items[i].result.ID < items[j].result.ID
 		}
@@ -624,7 +667,7 @@ func (s *SearchService) enrichSearchResults(ctx context.Context, results []Searc
 		return
 	}
 
-	memeMap := make(map[string]*domain.Meme)
+	memeMap := make(map[string]*domain.Meme, len(memes))
 	for i := range memes {
 		memeMap[memes[i].ID] = &memes[i]
 	}
@@ -935,25 +978,15 @@ func (s *SearchService) ListMemes(ctx context.Context, category string, limit, o
 //   - map[string]interface{}: aggregated stats for search and ingest.
 //   - error: non-nil if statistics cannot be computed.
 func (s *SearchService) GetStats(ctx context.Context) (map[string]interface{}, error) {
-	activeCount, err := s.memeRepo.CountByStatus(ctx, domain.MemeStatusActive)
-	if err != nil {
-		return nil, err
-	}
-
-	pendingCount, err := s.memeRepo.CountByStatus(ctx, domain.MemeStatusPending)
-	if err != nil {
-		return nil, err
-	}
-
-	categories, err := s.memeRepo.GetCategories(ctx)
+	memeStats, err := s.memeRepo.GetStats(ctx)
 	if err != nil {
 		return nil, err
 	}
 
 	return map[string]interface{}{
-		"total_active":          activeCount,
-		"total_pending":         pendingCount,
-		"total_categories":      len(categories),
+		"total_active":          memeStats.ActiveCount,
+		"total_pending":         memeStats.PendingCount,
+		"total_categories":      memeStats.CategoryCount,
 		"available_collections": s.GetAvailableCollections(),
 		"available_profiles":    s.GetAvailableProfiles(),
 	}, nil
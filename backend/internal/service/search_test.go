@@ -1,8 +1,12 @@
 package service
 
 import (
+	"context"
+	"errors"
 	"reflect"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/timmy/emomo/internal/repository"
 )
@@ -94,3 +98,45 @@ func TestFuseProfileResultsCombinesRoutesByMemeID(t *testing.T) {
 		t.Fatalf("first result score = %v, want normalized score 1", results[0].Score)
 	}
 }
+
+// rendezvousEmbeddingProvider only answers once every provider sharing the
+// barrier has been entered, so a sequential caller times out.
+type rendezvousEmbeddingProvider struct {
+	fixedEmbeddingProvider
+	arrived *sync.WaitGroup
+	vector  []float32
+}
+
+func (p rendezvousEmbeddingProvider) EmbedQuery(context.Context, string) ([]float32, error) {
+	p.arrived.Done()
+	allArrived := make(chan struct{})
+	go func() {
+		p.arrived.Wait()
+		close(allArrived)
+	}()
+	select {
+	case <-allArrived:
+		return p.vector, nil
+	case <-time.After(2 * time.Second):
+		return nil, errors.New("embedding routes were not requested concurrently")
+	}
+}
+
+func TestEmbedProfileQueryEmbedsRoutesConcurrently(t *testing.T) {
+	t.Parallel()
+
+	var arrived sync.WaitGroup
+	arrived.Add(2)
+	profile := &SearchProfileConfig{
+		Image:   &CollectionConfig{Embedding: rendezvousEmbeddingProvider{arrived: &arrived, vector: []float32{1}}},
+		Caption: &CollectionConfig{Embedding: rendezvousEmbeddingProvider{arrived: &arrived, vector: []float32{2}}},
+	}
+
+	imageEmbedding, captionEmbedding, err := embedProfileQuery(context.Background(), profile, "无语")
+	if err != nil {
+		t.Fatalf("embedProfileQuery() error = %v", err)
+	}
+	if !reflect.DeepEqual(imageEmbedding, []float32{1}) || !reflect.DeepEqual(captionEmbedding, []float32{2}) {
+		t.Fatalf("embedProfileQuery() = %v, %v, want [1], [2]", imageEmbedding, captionEmbedding)
+	}
+}
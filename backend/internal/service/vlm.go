@@ -4,6 +4,7 @@ import (
 	"context"
 	"encoding/base64"
 	"fmt"
+	"strings"
 	"time"
 
 	"github.com/go-resty/resty/v2"
@@ -25,6 +26,42 @@ var InternetMemes = []string{
 	"笑死", "裂开", "麻了", "蚌埠住了", "绷不住了", "DNA动了",
 }
 
+// lexiconTerm pairs a lexicon word with its lower-cased form so keyword
+// matching does not re-lowercase the whole lexicon on every call.
+type lexiconTerm struct {
+	word  string
+	lower string
+}
+
+var (
+	emotionTerms      = newLexiconTerms(EmotionWords)
+	internetMemeTerms = newLexiconTerms(InternetMemes)
+
+	// emotionMatcher indexes match positions in emotionTerms; intentMatcher
+	// covers emotionTerms followed by internetMemeTerms.
+	emotionMatcher = newKeywordMatcher(lexiconLowers(emotionTerms))
+	intentMatcher  = newKeywordMatcher(append(lexiconLowers(emotionTerms), lexiconLowers(internetMemeTerms)...))
+)
+
+func newLexiconTerms(words []string) []lexiconTerm {
+	terms := make([]lexiconTerm, 0, len(words))
+	for _, word := range words {
+		if word == "" {
+			continue
+		}
+		terms = append(terms, lexiconTerm{word: word, lower: strings.ToLower(word)})
+	}
+	return terms
+}
+
+func lexiconLowers(terms []lexiconTerm) []string {
+	lowers := make([]string, len(terms))
+	for i, term := range terms {
+		lowers[i] = term.lower
+	}
+	return lowers
+}
+
 const (
 	// VLM System Prompt - 定义角色和规则
 	vlmSystemPrompt = `你是表情包语义分析专家，负责生成用于向量搜索的描述文本。你的描述将被转换为向量，用于语义搜索匹配。
@@ -2,6 +2,7 @@ package localdir
 
 import (
 	"bufio"
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -11,6 +12,9 @@ import (
 	"sort"
 	"strconv"
 	"strings"
+	"sync"
+	"time"
+	"unicode/utf8"
 
 	"github.com/timmy/emomo/internal/source"
 )
@@ -35,28 +39,48 @@ type Adapter struct {
 	manifestPath string
 	queuePath    string
 
+	// mu guards the scan results and the metadata cache for FetchBatch.
+	mu     sync.Mutex
 	items  []source.MemeItem
 	loaded bool
+
+	// The parsed manifest and queue are kept across scans and reused while
+	// the file's modification time and size are unchanged. metadataParses
+	// counts how often either file was actually parsed.
+	manifestStamp  fileStamp
+	manifest       map[string]stage2Record
+	queueStamp     fileStamp
+	queue          map[string]queueRecord
+	metadataParses int
+}
+
+// fileStamp identifies one version of a metadata file on disk.
+type fileStamp struct {
+	modTime time.Time
+	size    int64
 }
 
+// equal reports whether s and other describe the same file version. Times are
+// compared with Equal, since == on time.Time also compares location data.
+func (s fileStamp) equal(other fileStamp) bool {
+	return s.size == other.size && s.modTime.Equal(other.modTime)
+}
+
+// stage2Record and queueRecord declare only the fields the adapter consumes;
+// encoding/json skips everything else (titles, reasons, authors, ...) without
+// allocating for it.
 type stage2Record struct {
-	NoteID     string  `json:"note_id"`
-	Filename   string  `json:"filename"`
-	Keyword    string  `json:"keyword"`
-	Title      string  `json:"title"`
-	Confidence float64 `json:"confidence"`
-	Reason     string  `json:"reason"`
-	Keep       bool    `json:"keep"`
+	NoteID   string `json:"note_id"`
+	Filename string `json:"filename"`
+	Keyword  string `json:"keyword"`
+	Keep     bool   `json:"keep"`
 }
 
 type queueRecord struct {
-	NoteID      string   `json:"note_id"`
-	Filename    string   `json:"filename"`
-	Keyword     string   `json:"keyword"`
-	Keywords    []string `json:"keywords"`
-	Title       string   `json:"title"`
-	Author      string   `json:"author"`
-	PublishedAt string   `json:"published_at"`
+	NoteID   string   `json:"note_id"`
+	Filename string   `json:"filename"`
+	Keyword  string   `json:"keyword"`
+	Keywords []string `json:"keywords"`
 }
 
 // NewAdapter creates a local directory source adapter.
@@ -94,8 +118,13 @@ func (a *Adapter) SupportsIncremental() bool {
 }
 
 // FetchBatch fetches a page of local image items.
+// An empty cursor starts a new run and rescans the directory; the manifest
+// and queue are only re-parsed when they changed since the previous scan.
 func (a *Adapter) FetchBatch(ctx context.Context, cursor string, limit int) ([]source.MemeItem, string, error) {
-	if !a.loaded {
+	a.mu.Lock()
+	defer a.mu.Unlock()
+
+	if !a.loaded || cursor == "" {
 		if err := a.loadItems(); err != nil {
 			return nil, "", err
 		}
@@ -136,17 +165,20 @@ func (a *Adapter) loadItems() error {
 		return fmt.Errorf("local directory root path is not accessible: %w", err)
 	}
 
-	manifest, err := loadStage2Manifest(a.manifestPath)
-	if err != nil {
-		return err
-	}
-	queue, err := loadStage1Queue(a.queuePath)
+	manifest, queue, err := a.loadMetadata()
 	if err != nil {
 		return err
 	}
 	useManifest := strings.TrimSpace(a.manifestPath) != ""
+	rootPrefix := walkRootPrefix(rootPath)
 
-	items := make([]source.MemeItem, 0)
+	// With a manifest, only its kept filenames are emitted, so size the result
+	// slice for them up front instead of growing it file by file.
+	itemCapacity := 0
+	if useManifest {
+		itemCapacity = len(manifest)
+	}
+	items := make([]source.MemeItem, 0, itemCapacity)
 	err = filepath.WalkDir(rootPath, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
@@ -171,19 +203,22 @@ func (a *Adapter) loadItems() error {
 			return nil
 		}
 
-		relPath, err := filepath.Rel(rootPath, path)
-		if err != nil {
-			return err
-		}
-		relPath = filepath.ToSlash(relPath)
-
+		// The manifest filter only needs the filename; apply it before any
+		// path work so unlisted files are dropped as cheaply as possible.
 		meta, hasManifest := manifest[name]
-		if useManifest && (!hasManifest || !meta.Keep) {
+		if useManifest && !hasManifest {
 			return nil
 		}
 		queueMeta := queue[name]
 
-		category := categoryFromRelPath(relPath)
+		relPath, err := relativeToRoot(rootPath, rootPrefix, path)
+		if err != nil {
+			return err
+		}
+
+		// Split once; category and path tags both derive from the segments.
+		parts := strings.Split(relPath, "/")
+		category := categoryFromPathParts(parts)
 		if meta.Keyword != "" {
 			category = meta.Keyword
 		} else if queueMeta.Keyword != "" {
@@ -196,7 +231,7 @@ func (a *Adapter) loadItems() error {
 			LocalPath: path,
 			Category:  category,
 			Format:    format,
-			Tags:      tagsForItem(a.sourceID, relPath, meta, queueMeta, category),
+			Tags:      tagsForItem(a.sourceID, parts, meta, queueMeta, category),
 		}
 		items = append(items, item)
 		return nil
@@ -212,21 +247,94 @@ func (a *Adapter) loadItems() error {
 	return nil
 }
 
+// loadMetadata returns the stage2 manifest and stage1 queue, re-parsing
+// each file only when its modification time or size changed. The caller
+// must hold a.mu.
+func (a *Adapter) loadMetadata() (map[string]stage2Record, map[string]queueRecord, error) {
+	manifestStamp, err := statFileStamp(a.manifestPath, "stage2 manifest")
+	if err != nil {
+		return nil, nil, err
+	}
+	if a.manifest == nil || !manifestStamp.equal(a.manifestStamp) {
+		manifest, err := loadStage2Manifest(a.manifestPath)
+		if err != nil {
+			return nil, nil, err
+		}
+		a.manifest, a.manifestStamp = manifest, manifestStamp
+		a.metadataParses++
+	}
+
+	queueStamp, err := statFileStamp(a.queuePath, "stage1 queue")
+	if err != nil {
+		return nil, nil, err
+	}
+	if a.queue == nil || !queueStamp.equal(a.queueStamp) {
+		queue, err := loadStage1Queue(a.queuePath)
+		if err != nil {
+			return nil, nil, err
+		}
+		a.queue, a.queueStamp = queue, queueStamp
+		a.metadataParses++
+	}
+
+	return a.manifest, a.queue, nil
+}
+
+// statFileStamp returns the cache key for an optional metadata file. An
+// unset path yields the zero stamp.
+func statFileStamp(path, label string) (fileStamp, error) {
+	if strings.TrimSpace(path) == "" {
+		return fileStamp{}, nil
+	}
+	info, err := os.Stat(path)
+	if err != nil {
+		return fileStamp{}, fmt.Errorf("failed to open %s: %w", label, err)
+	}
+	return fileStamp{modTime: info.ModTime(), size: info.Size()}, nil
+}
+
+// walkRootPrefix returns the prefix WalkDir puts in front of every entry
+// below rootPath, so relative paths can be sliced off instead of running
+// filepath.Rel for each file.
+func walkRootPrefix(rootPath string) string {
+	cleaned := filepath.Clean(rootPath)
+	if cleaned == "." {
+		return ""
+	}
+	if strings.HasSuffix(cleaned, string(filepath.Separator)) {
+		return cleaned
+	}
+	return cleaned + string(filepath.Separator)
+}
+
+func relativeToRoot(rootPath, rootPrefix, path string) (string, error) {
+	if strings.HasPrefix(path, rootPrefix) {
+		return filepath.ToSlash(path[len(rootPrefix):]), nil
+	}
+	relPath, err := filepath.Rel(rootPath, path)
+	if err != nil {
+		return "", err
+	}
+	return filepath.ToSlash(relPath), nil
+}
+
+// formatFromFilename maps a supported image extension to its format. The
+// extension is compared case-insensitively in place, without lowercasing.
 func formatFromFilename(name string) (string, bool) {
-	switch strings.ToLower(filepath.Ext(name)) {
-	case ".jpg", ".jpeg":
+	ext := filepath.Ext(name)
+	switch {
+	case strings.EqualFold(ext, ".jpg"), strings.EqualFold(ext, ".jpeg"):
 		return "jpeg", true
-	case ".png":
+	case strings.EqualFold(ext, ".png"):
 		return "png", true
-	case ".webp":
+	case strings.EqualFold(ext, ".webp"):
 		return "webp", true
 	default:
 		return "", false
 	}
 }
 
-func categoryFromRelPath(relPath string) string {
-	parts := strings.Split(relPath, "/")
+func categoryFromPathParts(parts []string) string {
 	if len(parts) <= 1 || strings.TrimSpace(parts[0]) == "" {
 		return defaultCategory
 	}
@@ -241,10 +349,10 @@ func sourceIDForItem(relPath string, filename string, meta stage2Record, queueMe
 	return relPath
 }
 
-func tagsForItem(sourceID string, relPath string, meta stage2Record, queueMeta queueRecord, category string) []string {
+func tagsForItem(sourceID string, parts []string, meta stage2Record, queueMeta queueRecord, category string) []string {
 	tags := make([]string, 0, 6)
 	tags = appendUnique(tags, category)
-	for _, tag := range tagsFromRelPath(relPath) {
+	for _, tag := range tagsFromPathParts(parts) {
 		tags = appendUnique(tags, tag)
 	}
 	tags = appendUnique(tags, meta.Keyword)
@@ -258,8 +366,7 @@ func tagsForItem(sourceID string, relPath string, meta stage2Record, queueMeta q
 	return tags
 }
 
-func tagsFromRelPath(relPath string) []string {
-	parts := strings.Split(filepath.ToSlash(relPath), "/")
+func tagsFromPathParts(parts []string) []string {
 	tags := make([]string, 0, len(parts)+2)
 	for i, part := range parts {
 		if i == len(parts)-1 {
@@ -279,7 +386,7 @@ func splitTagTokens(value string) []string {
 	tokens := make([]string, 0, len(fields))
 	for _, field := range fields {
 		field = strings.TrimSpace(field)
-		if len([]rune(field)) > 1 && !isNumeric(field) {
+		if utf8.RuneCountInString(field) > 1 && !isNumeric(field) {
 			tokens = append(tokens, field)
 		}
 	}
@@ -317,38 +424,34 @@ func firstNonEmpty(values ...string) string {
 	return ""
 }
 
+// loadStage2Manifest returns the kept stage2 records keyed by filename.
 func loadStage2Manifest(path string) (map[string]stage2Record, error) {
 	records := make(map[string]stage2Record)
 	if strings.TrimSpace(path) == "" {
 		return records, nil
 	}
 
-	file, err := os.Open(path)
-	if err != nil {
-		return nil, fmt.Errorf("failed to open stage2 manifest: %w", err)
-	}
-	defer file.Close()
-
-	scanner := bufio.NewScanner(file)
-	scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
-	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
-			continue
-		}
+	err := scanJSONLines(path, "stage2 manifest", func(line []byte) error {
 		var record stage2Record
-		if err := json.Unmarshal([]byte(line), &record); err != nil {
-			return nil, fmt.Errorf("failed to parse stage2 manifest line: %w", err)
+		if err := json.Unmarshal(line, &record); err != nil {
+			return err
 		}
 		if record.Filename == "" {
-			continue
+			return nil
 		}
-		records[record.Filename] = record
-	}
-	if err := scanner.Err(); err != nil {
-		return nil, fmt.Errorf("failed to read stage2 manifest: %w", err)
+		// Only kept records are ever consulted; a rejected filename behaves
+		// exactly like an unlisted one, so it is not stored at all. A later
+		// rejection still overrides an earlier keep for the same file.
+		if record.Keep {
+			records[record.Filename] = record
+		} else {
+			delete(records, record.Filename)
+		}
+		return nil
+	})
+	if err != nil {
+		return nil, err
 	}
-
 	return records, nil
 }
 
@@ -358,31 +461,57 @@ func loadStage1Queue(path string) (map[string]queueRecord, error) {
 		return records, nil
 	}
 
+	err := scanJSONLines(path, "stage1 queue", func(line []byte) error {
+		var record queueRecord
+		if err := json.Unmarshal(line, &record); err != nil {
+			return err
+		}
+		if record.Filename != "" {
+			records[record.Filename] = record
+		}
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+	return records, nil
+}
+
+const (
+	maxJSONLineBufferSize = 64 * 1024
+	maxJSONLineSize       = 1024 * 1024
+)
+
+// scanJSONLines streams a JSONL file line by line through one buffered
+// reader and hands each non-blank line to decode. The line slice is only
+// valid for the duration of the call. The initial buffer is sized to the
+// file, so small manifests do not allocate the full 64KB up front.
+func scanJSONLines(path, label string, decode func(line []byte) error) error {
 	file, err := os.Open(path)
 	if err != nil {
-		return nil, fmt.Errorf("failed to open stage1 queue: %w", err)
+		return fmt.Errorf("failed to open %s: %w", label, err)
 	}
 	defer file.Close()
 
+	bufferSize := maxJSONLineBufferSize
+	if info, err := file.Stat(); err == nil && info.Size() < int64(bufferSize) {
+		bufferSize = int(info.Size()) + 1
+	}
+
 	scanner := bufio.NewScanner(file)
-	scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
+	scanner.Buffer(make([]byte, 0, bufferSize), maxJSONLineSize)
 	for scanner.Scan() {
-		line := strings.TrimSpace(scanner.Text())
-		if line == "" {
+		// Decode straight from the scanner's buffer; no per-line string copy.
+		line := bytes.TrimSpace(scanner.Bytes())
+		if len(line) == 0 {
 			continue
 		}
-		var record queueRecord
-		if err := json.Unmarshal([]byte(line), &record); err != nil {
-			return nil, fmt.Errorf("failed to parse stage1 queue line: %w", err)
+		if err := decode(line); err != nil {
+			return fmt.Errorf("failed to parse %s line: %w", label, err)
 		}
-		if record.Filename == "" {
-			continue
-		}
-		records[record.Filename] = record
 	}
 	if err := scanner.Err(); err != nil {
-		return nil, fmt.Errorf("failed to read stage1 queue: %w", err)
+		return fmt.Errorf("failed to read %s: %w", label, err)
 	}
-
-	return records, nil
+	return nil
 }
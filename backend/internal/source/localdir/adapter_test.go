@@ -122,3 +122,153 @@ func TestFetchBatchUsesXiaohongshuManifestAndQueueMetadata(t *testing.T) {
 		}
 	}
 }
+
+func TestFetchBatchDerivesRelativePathsFromUncleanRoot(t *testing.T) {
+	t.Parallel()
+
+	root := t.TempDir()
+	writeFile(t, filepath.Join(root, "dog", "smile.png"), "png")
+
+	adapter := NewAdapter(Options{RootPath: root + string(filepath.Separator) + "." + string(filepath.Separator)})
+	items, _, err := adapter.FetchBatch(context.Background(), "", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() error = %v", err)
+	}
+	if len(items) != 1 {
+		t.Fatalf("FetchBatch() returned %d items, want 1", len(items))
+	}
+	if got := items[0].SourceID; got != "dog/smile.png" {
+		t.Fatalf("SourceID = %q, want dog/smile.png", got)
+	}
+	if got := items[0].Category; got != "dog" {
+		t.Fatalf("Category = %q, want dog", got)
+	}
+}
+
+func TestFetchBatchRescansDirectoryOnEachNewRun(t *testing.T) {
+	t.Parallel()
+
+	root := t.TempDir()
+	writeFile(t, filepath.Join(root, "a_1.jpg"), "jpg")
+
+	adapter := NewAdapter(Options{RootPath: root})
+	items, _, err := adapter.FetchBatch(context.Background(), "", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() error = %v", err)
+	}
+	if len(items) != 1 {
+		t.Fatalf("FetchBatch() returned %d items, want 1", len(items))
+	}
+
+	// A file added between runs shows up in the next run, which starts with
+	// an empty cursor.
+	writeFile(t, filepath.Join(root, "b_1.jpg"), "jpg")
+	items, _, err = adapter.FetchBatch(context.Background(), "", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() second run error = %v", err)
+	}
+	if len(items) != 2 {
+		t.Fatalf("FetchBatch() second run returned %d items, want 2", len(items))
+	}
+
+	// Paging within a run keeps the snapshot taken when the run started.
+	writeFile(t, filepath.Join(root, "c_1.jpg"), "jpg")
+	items, next, err := adapter.FetchBatch(context.Background(), "1", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() page error = %v", err)
+	}
+	if len(items) != 1 || items[0].SourceID != "b_1.jpg" || next != "" {
+		t.Fatalf("FetchBatch() page = %+v, next=%q, want only b_1.jpg from the run snapshot", items, next)
+	}
+}
+
+func TestFetchBatchReusesUnchangedManifestAcrossRuns(t *testing.T) {
+	t.Parallel()
+
+	root := t.TempDir()
+	writeFile(t, filepath.Join(root, "a_1.jpg"), "jpg")
+	writeFile(t, filepath.Join(root, "b_1.jpg"), "jpg")
+
+	manifestPath := filepath.Join(t.TempDir(), "stage2_results.jsonl")
+	writeFile(t, manifestPath, `{"note_id":"a","filename":"a_1.jpg","keep":true}`+"\n")
+
+	adapter := NewAdapter(Options{RootPath: root, ManifestPath: manifestPath})
+	items, _, err := adapter.FetchBatch(context.Background(), "", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() error = %v", err)
+	}
+	if len(items) != 1 {
+		t.Fatalf("FetchBatch() returned %d items, want 1", len(items))
+	}
+
+	parses := adapter.metadataParses
+	if parses == 0 {
+		t.Fatal("metadataParses = 0 after first run, want the manifest parsed")
+	}
+
+	items, _, err = adapter.FetchBatch(context.Background(), "", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() second run error = %v", err)
+	}
+	if len(items) != 1 {
+		t.Fatalf("FetchBatch() second run returned %d items, want 1", len(items))
+	}
+	if adapter.metadataParses != parses {
+		t.Fatalf("metadataParses = %d after unchanged run, want %d", adapter.metadataParses, parses)
+	}
+
+	writeFile(t, manifestPath,
+		`{"note_id":"a","filename":"a_1.jpg","keep":false}`+"\n"+
+			`{"note_id":"b","filename":"b_1.jpg","keep":true}`+"\n")
+	items, _, err = adapter.FetchBatch(context.Background(), "", 10)
+	if err != nil {
+		t.Fatalf("FetchBatch() after manifest update error = %v", err)
+	}
+	if len(items) != 1 || items[0].SourceID != "b:b_1.jpg" {
+		t.Fatalf("FetchBatch() after manifest update = %+v, want only b:b_1.jpg", items)
+	}
+	if adapter.metadataParses != parses+1 {
+		t.Fatalf("metadataParses = %d after manifest update, want %d", adapter.metadataParses, parses+1)
+	}
+}
+
+func TestLoadStage2ManifestKeepsOnlyAcceptedRecords(t *testing.T) {
+	t.Parallel()
+
+	manifestPath := filepath.Join(t.TempDir(), "stage2_results.jsonl")
+	writeFile(t, manifestPath,
+		`{"note_id":"a","filename":"a_1.jpg","keep":true}`+"\n"+
+			`{"note_id":"b","filename":"b_1.jpg","keep":false}`+"\n"+
+			`{"note_id":"c","filename":"c_1.jpg","keep":true}`+"\n"+
+			`{"note_id":"c","filename":"c_1.jpg","keep":false}`+"\n")
+
+	records, err := loadStage2Manifest(manifestPath)
+	if err != nil {
+		t.Fatalf("loadStage2Manifest() error = %v", err)
+	}
+	if len(records) != 1 {
+		t.Fatalf("loadStage2Manifest() returned %d records, want 1: %+v", len(records), records)
+	}
+	if _, ok := records["a_1.jpg"]; !ok {
+		t.Fatalf("loadStage2Manifest() = %+v, want a_1.jpg", records)
+	}
+}
+
+func TestFormatFromFilenameIgnoresExtensionCase(t *testing.T) {
+	t.Parallel()
+
+	cases := map[string]string{
+		"a.JPG":  "jpeg",
+		"b.Jpeg": "jpeg",
+		"c.PNG":  "png",
+		"d.webP": "webp",
+		"e.gif":  "",
+		"f":      "",
+	}
+	for name, want := range cases {
+		got, ok := formatFromFilename(name)
+		if got != want || ok != (want != "") {
+			t.Fatalf("formatFromFilename(%q) = %q, %v, want %q", name, got, ok, want)
+		}
+	}
+}